@@ -22,7 +22,10 @@ app.register_blueprint(veeam_bp, url_prefix='/api/veeam')
 app.register_blueprint(extraction_bp, url_prefix='/api/extraction')
 
 # uncomment if you need to use database
-app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get(
+    'SQLALCHEMY_DATABASE_URI',
+    f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
+)
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 db.init_app(app)
 with app.app_context():
@@ -50,18 +53,18 @@ with app.app_context():
         # Update database backup statuses based on reconciled state
         for session_id, session_info in veeam_api.mount_sessions.items():
             # Find backup in database by backup_id
-            backup = VeeamBackup.query.filter_by(backup_id=session_info['backup_id']).first()
+            backup = VeeamBackup.query.filter_by(backup_id=session_info.backup_id).first()
             if backup:
-                if session_info['state'] == 'Working':
+                if session_info.state == 'Working':
                     backup.status = 'mounted'
-                    backup.mount_point = session_info.get('mount_point', session_id)
+                    backup.mount_point = session_info.mount_point
                 else:
                     backup.status = 'available'
                     backup.mount_point = None
                 backup.updated_at = datetime.utcnow()
         
         # Mark all backups as 'available' if they're not in active sessions
-        active_backup_ids = {session_info['backup_id'] for session_info in veeam_api.mount_sessions.values()}
+        active_backup_ids = {session_info.backup_id for session_info in veeam_api.mount_sessions.values()}
         stale_backups = VeeamBackup.query.filter(
             VeeamBackup.status == 'mounted',
             ~VeeamBackup.backup_id.in_(active_backup_ids)
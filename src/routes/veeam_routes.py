@@ -32,6 +32,10 @@ def configure_veeam_connection():
             if field not in data:
                 return jsonify({'error': f'Missing required field: {field}'}), 400
         
+        # The replaced client's token refresher would otherwise keep running
+        if veeam_api is not None:
+            veeam_api.stop_token_refresher()
+        
         # Initialize Veeam API client with mount server configuration
         veeam_api = VeeamDataIntegrationAPI(
             base_url=data['base_url'],
@@ -129,17 +133,12 @@ def list_backups():
         
         # Get backup objects first
         backup_objects_url = f"{veeam_api.base_url}/api/v1/backupObjects"
-        headers = {
-            'accept': 'application/json',
-            'x-api-version': '1.2-rev0',
-            'Authorization': f'Bearer {veeam_api.auth_token}'
-        }
-        
-        response = veeam_api.session.get(backup_objects_url, headers=headers)
+        # accept, x-api-version and Authorization are session-level defaults
+        response = veeam_api.session.get(backup_objects_url)
         if response.status_code != 200:
             return jsonify({'error': f'Failed to get backup objects: {response.text}'}), 500
             
-        backup_objects_response = response.json()
+        backup_objects_response = veeam_api._json(response)
         backup_objects = backup_objects_response.get('data', [])
         
         # Get restore points for each backup object
@@ -148,10 +147,10 @@ def list_backups():
             try:
                 # Get restore points for this backup object
                 restore_points_url = f"{veeam_api.base_url}/api/v1/backupObjects/{backup_obj['id']}/restorePoints"
-                response = veeam_api.session.get(restore_points_url, headers=headers)
+                response = veeam_api.session.get(restore_points_url)
                 
                 if response.status_code == 200:
-                    restore_points_response = response.json()
+                    restore_points_response = veeam_api._json(response)
                     restore_points = restore_points_response.get('data', [])
                     
                     # Add restore points with backup object info
@@ -217,15 +216,10 @@ def debug_credentials():
     try:
         # Get credentials directly
         credentials_url = f"{veeam_api.base_url}/api/v1/credentials"
-        headers = {
-            'accept': 'application/json',
-            'x-api-version': '1.2-rev0',
-            'Authorization': f'Bearer {veeam_api.auth_token}'
-        }
-        
-        response = veeam_api.session.get(credentials_url, headers=headers)
+        # accept, x-api-version and Authorization are session-level defaults
+        response = veeam_api.session.get(credentials_url)
         response.raise_for_status()
-        credentials_response = response.json()
+        credentials_response = veeam_api._json(response)
         
         return jsonify({
             'credentials': credentials_response
@@ -320,11 +314,7 @@ def unmount_backup(backup_id):
             return jsonify({'error': 'Backup is not currently mounted'}), 400
         
         # Get session ID from request or find it in veeam_api.mount_sessions
-        session_id = None
-        for sid, session_info in veeam_api.mount_sessions.items():
-            if session_info['backup_id'] == backup.backup_id:
-                session_id = sid
-                break
+        session_id = veeam_api.mount_sessions.session_for_backup(backup.backup_id)
         
         if session_id:
             try:
@@ -407,18 +397,14 @@ def scan_backup_files(backup_id):
             return jsonify({'error': 'Backup is not mounted'}), 400
         
         # Get mount session info to determine mount type
-        mount_session_info = None
-        for sid, session_info in veeam_api.mount_sessions.items():
-            if sid == session_id:
-                mount_session_info = session_info
-                break
+        mount_session_info = veeam_api.mount_sessions.get(session_id)
         
-        mount_type = mount_session_info.get('mount_type', 'FLR') if mount_session_info else 'FLR'
+        mount_type = mount_session_info.mount_type if mount_session_info else 'FLR'
         
         # Handle FLR mounts with UNC path access
         if mount_type == 'FLR':
             # FLR mounts provide direct UNC path access
-            unc_path = mount_session_info.get('mount_point') if mount_session_info else f"\\\\172.21.234.6\\VeeamFLR\\{session_id}"
+            unc_path = mount_session_info.mount_point if mount_session_info else f"\\\\172.21.234.6\\VeeamFLR\\{session_id}"
             
             try:
                 logger.info(f"Scanning UNC path: {unc_path}")
@@ -698,11 +684,11 @@ def reconcile_mount_state():
         # Update database backup statuses based on reconciled state
         for session_id, session_info in veeam_api.mount_sessions.items():
             # Find backup in database by backup_id
-            backup = VeeamBackup.query.filter_by(backup_id=session_info['backup_id']).first()
+            backup = VeeamBackup.query.filter_by(backup_id=session_info.backup_id).first()
             if backup:
-                if session_info['state'] == 'Working':
+                if session_info.state == 'Working':
                     backup.status = 'mounted'
-                    backup.mount_point = session_info.get('mount_point', session_id)
+                    backup.mount_point = session_info.mount_point
                 else:
                     backup.status = 'available'
                     backup.mount_point = None
@@ -6,6 +6,7 @@ import logging
 import pandas as pd
 from typing import Dict, List, Any, Optional, Generator
 from datetime import datetime
+from functools import cached_property
 import sqlite3
 import xml.etree.ElementTree as ET
 from pathlib import Path
@@ -388,11 +389,15 @@ class DataExtractionService:
     
     def __init__(self, mount_point: str):
         self.mount_point = mount_point
-        self.extractors = {
-            'log': LogFileExtractor(mount_point),
-            'database': DatabaseExtractor(mount_point),
-            'config': ConfigFileExtractor(mount_point),
-            'structured': StructuredDataExtractor(mount_point)
+    
+    @cached_property
+    def extractors(self) -> Dict[str, BaseDataExtractor]:
+        """Extractors keyed by type, built on first use."""
+        return {
+            'log': LogFileExtractor(self.mount_point),
+            'database': DatabaseExtractor(self.mount_point),
+            'config': ConfigFileExtractor(self.mount_point),
+            'structured': StructuredDataExtractor(self.mount_point)
         }
     
     def extract_data(self, file_path: str, extractor_type: str, **kwargs) -> pd.DataFrame:
@@ -25,6 +25,14 @@ from src.services.unc_file_scanner import scan_unc_path
 
 logger = logging.getLogger(__name__)
 
+# File type categories accepted by each category-based file filter
+_FILTER_FILE_TYPES = {
+    FileTypeFilter.DOCUMENTS_ONLY: frozenset({'document', 'spreadsheet', 'presentation'}),
+    FileTypeFilter.DATABASES_ONLY: frozenset({'sqlite_db', 'sqlserver_db', 'oracle_db', 'sql_dump'}),
+    FileTypeFilter.LOGS_ONLY: frozenset({'log'}),
+    FileTypeFilter.CONFIG_ONLY: frozenset({'config'}),
+}
+
 class ExtractionJobService:
     """
     Service for managing configurable extraction jobs.
@@ -188,22 +196,15 @@ class ExtractionJobService:
             job.set_status(JobStatus.RUNNING)
             execution.status = JobStatus.RUNNING
             
-            # Get mount session info
-            session_id = None
-            mount_type = 'FLR'
-            unc_path = None
-            
             # Find the mount session for this backup
-            for sid, session_info in veeam_api.mount_sessions.items():
-                if session_info.get('backup_id') == job.backup_id:
-                    session_id = sid
-                    mount_type = session_info.get('mount_type', 'FLR')
-                    unc_path = session_info.get('mount_point')
-                    break
-            
+            session_id = veeam_api.mount_sessions.session_for_backup(job.backup_id)
             if not session_id:
                 raise ValueError(f"No active mount session found for backup {job.backup_id}")
             
+            session_info = veeam_api.mount_sessions[session_id]
+            mount_type = session_info.mount_type
+            unc_path = session_info.mount_point
+            
             execution.session_id = session_id
             execution.mount_type = mount_type
             execution.unc_path = unc_path
@@ -492,34 +493,18 @@ class ExtractionJobService:
     
     def _filter_files(self, files: List[Dict[str, Any]], job: ExtractionJob) -> List[Dict[str, Any]]:
         """Filter files based on job configuration."""
-        filtered = []
+        files = [f for f in files if not f.get('is_directory', False)]
         
-        for file_info in files:
-            if file_info.get('is_directory', False):
-                continue
-            
-            # Apply file type filter
-            if job.file_type_filter == FileTypeFilter.ALL_FILES:
-                filtered.append(file_info)
-            elif job.file_type_filter == FileTypeFilter.DOCUMENTS_ONLY:
-                if file_info.get('file_type') in ['document', 'spreadsheet', 'presentation']:
-                    filtered.append(file_info)
-            elif job.file_type_filter == FileTypeFilter.DATABASES_ONLY:
-                if file_info.get('file_type') in ['sqlite_db', 'sqlserver_db', 'oracle_db', 'sql_dump']:
-                    filtered.append(file_info)
-            elif job.file_type_filter == FileTypeFilter.LOGS_ONLY:
-                if file_info.get('file_type') == 'log':
-                    filtered.append(file_info)
-            elif job.file_type_filter == FileTypeFilter.CONFIG_ONLY:
-                if file_info.get('file_type') == 'config':
-                    filtered.append(file_info)
-            elif job.file_type_filter == FileTypeFilter.CUSTOM:
-                custom_types = json.loads(job.custom_file_types) if job.custom_file_types else []
-                file_ext = os.path.splitext(file_info.get('name', ''))[1].lower()
-                if file_ext in custom_types:
-                    filtered.append(file_info)
+        # Resolve the filter to a set once, then test each file with one lookup
+        if job.file_type_filter == FileTypeFilter.ALL_FILES:
+            return files
+        if job.file_type_filter == FileTypeFilter.CUSTOM:
+            custom_types = frozenset(json.loads(job.custom_file_types) if job.custom_file_types else ())
+            splitext = os.path.splitext
+            return [f for f in files if splitext(f.get('name', ''))[1].lower() in custom_types]
         
-        return filtered
+        allowed_types = _FILTER_FILE_TYPES.get(job.file_type_filter, frozenset())
+        return [f for f in files if f.get('file_type') in allowed_types]
     
     def _should_extract_content(self, file_info: Dict[str, Any], job: ExtractionJob) -> bool:
         """Determine if file should have content extracted."""
@@ -223,7 +223,8 @@ class ClassificationProcessor:
         self.feature_importance = None
     
     def train_and_predict(self, X: pd.DataFrame, y: pd.Series, 
-                         test_size: float = 0.2) -> Dict[str, Any]:
+                         test_size: float = 0.2,
+                         model_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Train a classification model and return predictions and metrics.
         
@@ -231,6 +232,8 @@ class ClassificationProcessor:
             X: Features DataFrame
             y: Target Series
             test_size: Proportion of data to use for testing
+            model_params: Optional RandomForestClassifier parameters overriding
+                the defaults (n_estimators=100, random_state=42)
             
         Returns:
             Dictionary containing model results
@@ -242,7 +245,7 @@ class ClassificationProcessor:
             )
             
             # Train model
-            self.model = RandomForestClassifier(n_estimators=100, random_state=42)
+            self.model = RandomForestClassifier(**{'n_estimators': 100, 'random_state': 42, **(model_params or {})})
             self.model.fit(X_train, y_train)
             
             # Make predictions
@@ -286,7 +289,8 @@ class RegressionProcessor:
         self.feature_importance = None
     
     def train_and_predict(self, X: pd.DataFrame, y: pd.Series, 
-                         test_size: float = 0.2) -> Dict[str, Any]:
+                         test_size: float = 0.2,
+                         model_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Train a regression model and return predictions and metrics.
         
@@ -294,6 +298,8 @@ class RegressionProcessor:
             X: Features DataFrame
             y: Target Series
             test_size: Proportion of data to use for testing
+            model_params: Optional RandomForestRegressor parameters overriding
+                the defaults (n_estimators=100, random_state=42)
             
         Returns:
             Dictionary containing model results
@@ -305,7 +311,7 @@ class RegressionProcessor:
             )
             
             # Train model
-            self.model = RandomForestRegressor(n_estimators=100, random_state=42)
+            self.model = RandomForestRegressor(**{'n_estimators': 100, 'random_state': 42, **(model_params or {})})
             self.model.fit(X_train, y_train)
             
             # Make predictions
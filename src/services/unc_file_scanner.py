@@ -7,12 +7,48 @@ using SMB protocol to access files on remote Windows shares.
 
 import os
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 from smb.SMBConnection import SMBConnection
 from smb.smb_structs import OperationFailure
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on directories listed concurrently (one SMB connection each)
+SCAN_MAX_WORKERS = 8
+
+# File type category by extension, built once rather than per listed file
+_FILE_TYPES = {
+    '.txt': 'text',
+    '.log': 'log',
+    '.csv': 'data',
+    '.json': 'data',
+    '.xml': 'data',
+    '.db': 'database',
+    '.sqlite': 'database',
+    '.sql': 'database',
+    '.doc': 'document',
+    '.docx': 'document',
+    '.pdf': 'document',
+    '.xls': 'spreadsheet',
+    '.xlsx': 'spreadsheet',
+    '.ini': 'config',
+    '.cfg': 'config',
+    '.conf': 'config',
+    '.exe': 'executable',
+    '.dll': 'executable',
+    '.sys': 'system',
+    '.reg': 'registry'
+}
+
+# Files suitable for ML extraction
+_EXTRACTABLE_EXTENSIONS = frozenset({
+    '.txt', '.log', '.csv', '.json', '.xml', '.db', '.sqlite', 
+    '.sql', '.doc', '.docx', '.pdf', '.xls', '.xlsx', '.ini', 
+    '.cfg', '.conf'
+})
+
 
 class UNCFileScanner:
     """Service for scanning files from UNC paths using SMB protocol"""
@@ -87,13 +123,15 @@ class UNCFileScanner:
             finally:
                 self.conn = None
     
-    def list_files(self, unc_path: str, max_depth: int = 3) -> List[Dict]:
+    def list_files(self, unc_path: str, max_depth: int = 3,
+                   max_workers: int = SCAN_MAX_WORKERS) -> List[Dict]:
         """
         List files from UNC path
         
         Args:
             unc_path: UNC path to scan
             max_depth: Maximum directory depth to scan
+            max_workers: Directories listed concurrently when scanning below the top level
             
         Returns:
             List of file dictionaries with metadata
@@ -102,10 +140,13 @@ class UNCFileScanner:
             server, share, path = self.parse_unc_path(unc_path)
             
             # Connect to server if not already connected
-            if not self.conn or not self.connect_to_server(server):
+            if not self.conn and not self.connect_to_server(server):
                 logger.error(f"Failed to connect to server {server}")
                 return []
             
+            if max_depth > 1 and max_workers > 1:
+                return self._scan_parallel(server, share, path, max_depth, max_workers)
+            
             files = []
             self._scan_directory(share, path, files, max_depth, 0)
             
@@ -115,53 +156,139 @@ class UNCFileScanner:
             logger.error(f"Error scanning UNC path {unc_path}: {str(e)}")
             return []
     
-    def _scan_directory(self, share: str, path: str, files: List[Dict], 
-                        max_depth: int, current_depth: int):
+    def _list_directory(self, conn: SMBConnection, share: str, path: str) -> List[Dict]:
         """
-        Recursively scan directory for files
+        List one directory into file dictionaries
         
         Args:
+            conn: Connected SMB connection to list with
             share: SMB share name
             path: Directory path within share
-            files: List to append found files
-            max_depth: Maximum depth to scan
-            current_depth: Current scanning depth
+            
+        Returns:
+            List of file dictionaries, empty if the directory cannot be read
         """
-        if current_depth >= max_depth:
-            return
-        
+        entries = []
         try:
-            # List files and directories in current path
-            file_list = self.conn.listPath(share, path)
-            
-            for file_info in file_list:
+            # listPath already returns size, timestamps and attributes for every
+            # entry in one directory query, so no per-file lookups are needed
+            for file_info in conn.listPath(share, path):
                 # Skip . and .. entries
                 if file_info.filename in ['.', '..']:
                     continue
                 
                 file_path = f"{path}\\{file_info.filename}" if path else file_info.filename
+                ext = os.path.splitext(file_info.filename)[1].lower()
                 
-                file_data = {
+                entries.append({
                     'name': file_info.filename,
                     'path': file_path,
                     'size': file_info.file_size,
                     'is_directory': file_info.isDirectory,
                     'created_time': str(file_info.create_time) if hasattr(file_info, 'create_time') else None,
                     'modified_time': str(file_info.last_write_time) if hasattr(file_info, 'last_write_time') else None,
-                    'file_type': self._get_file_type(file_info.filename),
-                    'extractable': self._is_extractable(file_info.filename, file_info.isDirectory)
-                }
-                
-                files.append(file_data)
-                
-                # Recursively scan subdirectories
-                if file_info.isDirectory and current_depth < max_depth - 1:
-                    self._scan_directory(share, file_path, files, max_depth, current_depth + 1)
+                    'file_type': _FILE_TYPES.get(ext, 'unknown'),
+                    'extractable': not file_info.isDirectory and ext in _EXTRACTABLE_EXTENSIONS
+                })
                     
         except OperationFailure as e:
             logger.warning(f"Cannot access directory {path} on share {share}: {str(e)}")
         except Exception as e:
             logger.error(f"Error scanning directory {path}: {str(e)}")
+        
+        return entries
+    
+    def _scan_directory(self, share: str, path: str, files: List[Dict], 
+                        max_depth: int, current_depth: int):
+        """
+        Recursively scan directory for files
+        
+        Args:
+            share: SMB share name
+            path: Directory path within share
+            files: List to append found files
+            max_depth: Maximum depth to scan
+            current_depth: Current scanning depth
+        """
+        if current_depth >= max_depth:
+            return
+        
+        for file_data in self._list_directory(self.conn, share, path):
+            files.append(file_data)
+            
+            # Recursively scan subdirectories
+            if file_data['is_directory'] and current_depth < max_depth - 1:
+                self._scan_directory(share, file_data['path'], files, max_depth, current_depth + 1)
+    
+    def _scan_parallel(self, server: str, share: str, path: str,
+                       max_depth: int, max_workers: int) -> List[Dict]:
+        """
+        Scan a directory tree one level at a time, listing each level's directories concurrently
+        
+        An SMB connection serves one request at a time, so each worker thread lists
+        through its own connection. Results are returned in the same depth-first
+        order as _scan_directory.
+        
+        Args:
+            server: Server IP or hostname
+            share: SMB share name
+            path: Root directory path within share
+            max_depth: Maximum depth to scan
+            max_workers: Maximum directories listed at once
+            
+        Returns:
+            List of file dictionaries with metadata
+        """
+        local = threading.local()
+        worker_conns = []
+        conns_lock = threading.Lock()
+        
+        def list_directory(dir_path: str) -> List[Dict]:
+            conn = getattr(local, 'conn', None)
+            if conn is None:
+                conn = SMBConnection(self.username, self.password, "veeam-ml-client", server, use_ntlm_v2=True)
+                with conns_lock:
+                    worker_conns.append(conn)
+                try:
+                    connected = conn.connect(server, 445)
+                except Exception as e:
+                    # Skip this directory, as the serial scan does when it cannot be read
+                    logger.error(f"SMB connection error to {server}: {str(e)}")
+                    return []
+                if not connected:
+                    logger.error(f"Failed to connect to SMB server {server}")
+                    return []
+                local.conn = conn
+            return self._list_directory(conn, share, dir_path)
+        
+        # dir path -> its entries; the root level reuses the scanner's own connection
+        listings = {path: self._list_directory(self.conn, share, path)}
+        level = [path]
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for _ in range(1, max_depth):
+                    level = [entry['path'] for dir_path in level for entry in listings[dir_path]
+                             if entry['is_directory']]
+                    if not level:
+                        break
+                    listings.update(zip(level, executor.map(list_directory, level)))
+        finally:
+            for conn in worker_conns:
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.debug(f"Error closing SMB worker connection: {str(e)}")
+        
+        files = []
+        
+        def emit(dir_path: str):
+            for entry in listings[dir_path]:
+                files.append(entry)
+                if entry['is_directory'] and entry['path'] in listings:
+                    emit(entry['path'])
+        
+        emit(path)
+        return files
     
     def _get_file_type(self, filename: str) -> str:
         """
@@ -175,30 +302,7 @@ class UNCFileScanner:
         """
         ext = os.path.splitext(filename)[1].lower()
         
-        type_mapping = {
-            '.txt': 'text',
-            '.log': 'log',
-            '.csv': 'data',
-            '.json': 'data',
-            '.xml': 'data',
-            '.db': 'database',
-            '.sqlite': 'database',
-            '.sql': 'database',
-            '.doc': 'document',
-            '.docx': 'document',
-            '.pdf': 'document',
-            '.xls': 'spreadsheet',
-            '.xlsx': 'spreadsheet',
-            '.ini': 'config',
-            '.cfg': 'config',
-            '.conf': 'config',
-            '.exe': 'executable',
-            '.dll': 'executable',
-            '.sys': 'system',
-            '.reg': 'registry'
-        }
-        
-        return type_mapping.get(ext, 'unknown')
+        return _FILE_TYPES.get(ext, 'unknown')
     
     def _is_extractable(self, filename: str, is_directory: bool) -> bool:
         """
@@ -214,19 +318,13 @@ class UNCFileScanner:
         if is_directory:
             return False
         
-        # Files suitable for ML extraction
-        extractable_extensions = {
-            '.txt', '.log', '.csv', '.json', '.xml', '.db', '.sqlite', 
-            '.sql', '.doc', '.docx', '.pdf', '.xls', '.xlsx', '.ini', 
-            '.cfg', '.conf'
-        }
-        
         ext = os.path.splitext(filename)[1].lower()
-        return ext in extractable_extensions
+        return ext in _EXTRACTABLE_EXTENSIONS
 
 
 def scan_unc_path(unc_path: str, username: str = "Administrator", 
-                 password: str = "Veeam123", max_depth: int = 3) -> List[Dict]:
+                 password: str = "Veeam123", max_depth: int = 3,
+                 max_workers: int = SCAN_MAX_WORKERS) -> List[Dict]:
     """
     Convenience function to scan UNC path for files
     
@@ -235,13 +333,14 @@ def scan_unc_path(unc_path: str, username: str = "Administrator",
         username: SMB username
         password: SMB password
         max_depth: Maximum directory depth
+        max_workers: Directories listed concurrently below the top level
         
     Returns:
         List of file dictionaries
     """
     scanner = UNCFileScanner(username, password)
     try:
-        files = scanner.list_files(unc_path, max_depth)
+        files = scanner.list_files(unc_path, max_depth, max_workers)
         return files
     finally:
         scanner.disconnect()
@@ -1,28 +1,335 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import asyncio
+import functools
+import ssl
+import threading
+import time
+import types
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Union
+from datetime import datetime, timezone
 import os
-import subprocess
 import urllib3
+from urllib3.util.retry import Retry
 
-# Disable SSL warnings for self-signed certificates
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# Fast JSON encoding for request bodies (falls back to stdlib json)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional incremental JSON parser for reading only the head of large listings
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Optional SIMD JSON parser giving lazy, key-on-demand access to large listings
+try:
+    import cysimdjson
+    HAS_CYSIMDJSON = True
+except ImportError:
+    HAS_CYSIMDJSON = False
+
+# Below this size a full orjson decode is cheaper than building a lazy document
+LAZY_PARSE_MIN_BYTES = 64 * 1024
+
+# Optional asyncio transport for fanning out independent API calls
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+# Preferred async transport: httpx with HTTP/2 multiplexing (needs the h2 extra)
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+    HAS_HTTPX_HTTP2 = True
+except ImportError:
+    HAS_HTTPX_HTTP2 = False
+
+HAS_ASYNC_HTTP = HAS_HTTPX_HTTP2 or HAS_AIOHTTP
 
 logger = logging.getLogger(__name__)
 
+# Restore point lists change only when a new backup run completes
+RESTORE_POINT_CACHE_TTL = 60
+
+# Maximum number of conditional-GET responses kept for ETag revalidation
+RESPONSE_CACHE_SIZE = 256
+
+# Upper bound on concurrent directory listings issued by list_tree()
+LIST_TREE_CONCURRENCY = 16
+
+# HTTP connection pool size; must cover the widest concurrent fan-out below
+HTTP_POOL_MAXSIZE = 64
+
+# Worker threads used to unmount sessions concurrently at shutdown
+CLEANUP_MAX_WORKERS = 16
+
+# Worker threads used to look up iSCSI mount info for several sessions at once
+ISCSI_INFO_MAX_WORKERS = 8
+
+# Fraction of the token lifetime after which the background refresher re-authenticates
+TOKEN_REFRESH_FRACTION = 0.8
+
+# Failed background refreshes in a row before the refresher gives up, and the first
+# retry delay in seconds (doubled after each failure) so bad credentials are not hammered
+TOKEN_REFRESH_MAX_FAILURES = 5
+TOKEN_REFRESH_RETRY_DELAY = 30
+
+# File type categories used to route files to ML extractors. Extensions are
+# inverted into _EXT_CATEGORY once so classification is a single dict lookup;
+# where an extension is listed twice the earlier category wins.
+FILE_TYPE_CATEGORIES = {
+    # Document types
+    'document': ('.pdf', '.doc', '.docx', '.txt', '.rtf'),
+    'spreadsheet': ('.xls', '.xlsx', '.csv'),
+    'presentation': ('.ppt', '.pptx'),
+    # Database types
+    'sqlserver_db': ('.mdf', '.ldf', '.ndf'),
+    'oracle_db': ('.dbf', '.ora'),
+    'sqlite_db': ('.sqlite', '.db', '.sqlite3'),
+    'sql_dump': ('.sql', '.dump'),
+    # Log and config files
+    'log': ('.log', '.txt'),
+    'config': ('.ini', '.cfg', '.conf', '.config', '.xml', '.json', '.yaml', '.yml'),
+    # Media files
+    'image': ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'),
+    'audio': ('.mp3', '.wav', '.flac', '.aac'),
+    'video': ('.mp4', '.avi', '.mkv', '.mov', '.wmv'),
+    # Executable and system files
+    'executable': ('.exe', '.dll', '.sys'),
+    'archive': ('.zip', '.rar', '.7z', '.tar', '.gz'),
+}
+
+_EXT_CATEGORY: Dict[str, str] = {}
+for _category, _extensions in FILE_TYPE_CATEGORIES.items():
+    for _ext in _extensions:
+        _EXT_CATEGORY.setdefault(_ext, _category)
+del _category, _extensions, _ext
+
+# Categories whose content the extraction pipeline can parse
+_ML_EXTRACTABLE_TYPES = frozenset({
+    'document', 'spreadsheet', 'presentation', 'log', 'config',
+    'sqlite_db', 'sql_dump', 'json', 'xml', 'csv'
+})
+
+_insecure_warnings_disabled = False
+_insecure_warnings_lock = threading.Lock()
+
+
+def _disable_insecure_warnings() -> None:
+    """Silence urllib3 InsecureRequestWarning once per process."""
+    global _insecure_warnings_disabled
+    with _insecure_warnings_lock:
+        if not _insecure_warnings_disabled:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            _insecure_warnings_disabled = True
+
+
+# Per-request header for pre-serialized JSON bodies; requests merges it
+# into the session headers without mutating it, so one dict is shared
+_JSON_CONTENT_TYPE = {'Content-Type': 'application/json'}
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _replay(first: Any, events):
+    """Put a peeked ijson parse event back in front of the rest of the stream."""
+    yield first
+    yield from events
+
+
+# (base_url, verify_ssl) -> pooled HTTPAdapter shared by API clients
+_shared_adapters: Dict[tuple, HTTPAdapter] = {}
+_shared_adapters_lock = threading.Lock()
+
+
+def _shared_adapter(base_url: str, verify_ssl: Union[bool, str]) -> HTTPAdapter:
+    """
+    Return the pooled transport adapter for a server, building it on first use.
+    
+    Only the connection pool is shared. Each client mounts it on its own
+    requests.Session, so the Authorization header and response hooks stay
+    with the client that set them.
+    
+    Args:
+        base_url: Normalized base URL of the Veeam server
+        verify_ssl: Whether to verify SSL certificates, or a path to a CA bundle
+        
+    Returns:
+        The HTTPAdapter for this server
+    """
+    key = (base_url, verify_ssl)
+    with _shared_adapters_lock:
+        adapter = _shared_adapters.get(key)
+        if adapter is None:
+            # Pool connections so TCP+TLS handshakes are amortized across calls; retry
+            # transient gateway errors on idempotent requests only (urllib3 default)
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            )
+            _shared_adapters[key] = adapter
+        return adapter
+
+
+def _client_session(base_url: str, verify_ssl: Union[bool, str]) -> requests.Session:
+    """
+    Build a client's own session on top of the shared connection pool.
+    
+    Args:
+        base_url: Normalized base URL of the Veeam server
+        verify_ssl: Whether to verify SSL certificates, or a path to a CA bundle
+        
+    Returns:
+        A requests.Session with the static API headers set
+    """
+    session = requests.Session()
+    adapter = _shared_adapter(base_url, verify_ssl)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Static headers shared by every call; Authorization is added after authenticate()
+    session.headers.update({
+        'accept': 'application/json',
+        'x-api-version': '1.2-rev0',
+        'Connection': 'keep-alive'
+    })
+    # A CA bundle path is passed straight through so TLS sessions are verified and reused
+    session.verify = verify_ssl
+    return session
+
+
 class VeeamAPIError(Exception):
     """Custom exception for Veeam API errors."""
     pass
 
+
+def _api_call(error_message: str):
+    """
+    Decorator translating requests failures into VeeamAPIError.
+    
+    A 401 on an authenticated client triggers one re-authentication (shared with
+    the background refresher) and a single retry.
+    
+    Args:
+        error_message: Prefix for the logged and raised error message
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            token = self.auth_token
+            try:
+                try:
+                    return func(self, *args, **kwargs)
+                except requests.exceptions.HTTPError as e:
+                    if token is None or e.response is None or e.response.status_code != 401:
+                        raise
+                    self._reauthenticate(token)
+                    return func(self, *args, **kwargs)
+            except requests.exceptions.RequestException as e:
+                logger.error("%s: %s", error_message, e)
+                raise VeeamAPIError(f"{error_message}: {str(e)}") from e
+        return wrapper
+    return decorator
+
+@dataclass(slots=True)
+class MountSession:
+    """Locally tracked mount session (full server details via get_mount_session_details)."""
+    backup_id: Optional[str]
+    mount_point: Optional[str]
+    mounted_at: int  # time.time_ns() epoch timestamp
+    mount_type: str = 'FLR'
+    restore_point_id: Optional[str] = None
+    folder_name: Optional[str] = None
+    state: Optional[str] = None
+    
+    @property
+    def mounted_at_iso(self) -> str:
+        """UTC ISO-8601 rendering of mounted_at, formatted on demand."""
+        return datetime.fromtimestamp(self.mounted_at / 1e9, timezone.utc).isoformat()
+
+class MountSessionRegistry(dict):
+    """
+    session_id -> MountSession mapping with a backup_id -> session_id index.
+    
+    Mutate through item assignment, del or pop so the index stays in step.
+    """
+    __slots__ = ('_by_backup',)
+    
+    def __init__(self):
+        super().__init__()
+        self._by_backup: Dict[Optional[str], str] = {}
+    
+    def __setitem__(self, session_id: str, session: MountSession) -> None:
+        previous = self.get(session_id)
+        super().__setitem__(session_id, session)
+        if previous is not None and previous.backup_id != session.backup_id:
+            self._unindex(session_id, previous.backup_id)
+        self._by_backup.setdefault(session.backup_id, session_id)
+    
+    def __delitem__(self, session_id: str) -> None:
+        session = self[session_id]
+        super().__delitem__(session_id)
+        self._unindex(session_id, session.backup_id)
+    
+    def pop(self, session_id: str, *default):
+        if session_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(session_id)
+        session = self[session_id]
+        del self[session_id]
+        return session
+    
+    def clear(self) -> None:
+        super().clear()
+        self._by_backup.clear()
+    
+    def session_for_backup(self, backup_id: str) -> Optional[str]:
+        """Return the earliest tracked session ID for a backup, if any."""
+        return self._by_backup.get(backup_id)
+    
+    def _unindex(self, session_id: str, backup_id: Optional[str]) -> None:
+        """Drop an index entry, promoting another session of the same backup."""
+        if self._by_backup.get(backup_id) != session_id:
+            return
+        del self._by_backup[backup_id]
+        for other_id, other in list(self.items()):
+            if other.backup_id == backup_id:
+                self._by_backup[backup_id] = other_id
+                break
+
 class VeeamDataIntegrationAPI:
     """
     Wrapper class for Veeam Data Integration API.
     Handles backup mounting, unmounting, and data access operations.
     """
     
-    def __init__(self, base_url: str, username: str, password: str, verify_ssl: bool = False,
+    def __init__(self, base_url: str, username: str, password: str, verify_ssl: Union[bool, str] = False,
              mount_server_name: str = None, mount_server_username: str = None, 
              mount_server_password: str = None, mount_host_id: str = None):
         """
@@ -32,7 +339,7 @@ class VeeamDataIntegrationAPI:
             base_url: Base URL of the Veeam Backup & Replication server
             username: Username for authentication
             password: Password for authentication
-            verify_ssl: Whether to verify SSL certificates
+            verify_ssl: Whether to verify SSL certificates, or a path to a CA bundle
             mount_server_name: DNS name or IP address of the mount server (for iSCSI)
             mount_server_username: Username for mount server (optional, defaults to main username)
             mount_server_password: Password for mount server (optional, defaults to main password)
@@ -46,11 +353,186 @@ class VeeamDataIntegrationAPI:
         self.mount_server_username = mount_server_username or username
         self.mount_server_password = mount_server_password or password
         self.mount_host_id = mount_host_id
-        self.session = requests.Session()
-        self.session.verify = verify_ssl
+        # Endpoint URLs are fixed once base_url is known; build them up front
+        b = self.base_url
+        self._u = types.SimpleNamespace(
+            auth=f'{b}/api/oauth2/token',
+            backups=f'{b}/api/v1/backups',
+            restore_points=f'{b}/api/v1/restorePoints',
+            flr=f'{b}/api/v1/restore/flr',
+            flr_unmount=f'{b}/api/v1/restore/flr/{{}}/unmount',
+            flr_files=f'{b}/api/v1/backupBrowser/flr/{{}}/files',
+            data_integration=f'{b}/api/v1/dataIntegration',
+            data_integration_publish=f'{b}/api/v1/dataIntegration/publish',
+            sessions=f'{b}/api/v1/sessions',
+            # Per-resource templates, filled with .format(resource_id)
+            backup=f'{b}/api/v1/backups/{{}}',
+            flr_session=f'{b}/api/v1/restore/flr/{{}}',
+            flr_compare=f'{b}/api/v1/backupBrowser/flr/{{}}/compareAttributes',
+            flr_unstructured_files=f'{b}/api/v1/backupBrowser/flr/unstructuredData/{{}}/files',
+            data_integration_session=f'{b}/api/v1/dataIntegration/{{}}',
+            data_integration_unpublish=f'{b}/api/v1/dataIntegration/{{}}/unpublish',
+            mount_session=f'{b}/api/v1.2-rev0/mount-sessions/{{}}',
+            mount_session_files=f'{b}/api/v1/mount-sessions/{{}}/files',
+            session=f'{b}/api/v1/sessions/{{}}',
+            session_logs=f'{b}/api/v1/sessions/{{}}/logs'
+        )
+        # Clients for the same server share one connection pool, so extra instances
+        # reuse warm TCP+TLS connections; credentials stay on this client's session
+        self.session = _client_session(self.base_url, verify_ssl)
+        # Report once whether the second request rode the first one's connection
+        self._first_socket = None
+        self.session.hooks['response'].append(self._log_connection_reuse)
+        if verify_ssl is False:
+            # Self-signed certificates: only silence warnings for insecure clients
+            _disable_insecure_warnings()
         self.auth_token = None
-        self.mount_sessions = {}  # Track active mount sessions
+        self._token_expiry = 0.0
+        self._auth_lock = threading.RLock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop = threading.Event()
+        self.mount_sessions = MountSessionRegistry()  # Track active mount sessions
+        self._aio = None  # Lazily created async client (httpx or aiohttp), bound to the running loop
+        self._aio_loop = None
+        self._restore_point_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._restore_point_cache_ts: Dict[str, float] = {}
+        # (url, params) -> (etag, last_modified, payload), least recently used first
+        self._response_cache: OrderedDict = OrderedDict()
+        # backup_id -> (latest restore point ID, monotonic time it was discovered)
+        self._rp_cache: Dict[str, tuple] = {}
+        # backup_id -> Event set once a mount of that backup is usable
+        self._mount_ready_events: Dict[Optional[str], threading.Event] = {}
+        self._mount_ready_lock = threading.Lock()
+        # (session_id, path) -> directory listing, dropped when the session is unmounted
+        self._fs_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+        
+    def _log_connection_reuse(self, response: requests.Response, *args, **kwargs) -> requests.Response:
+        """One-shot response hook logging whether keep-alive reused the first connection."""
+        sock = getattr(getattr(response.raw, '_connection', None), 'sock', None)
+        if sock is None:
+            return response
+        if self._first_socket is None:
+            self._first_socket = sock
+            return response
+        
+        logger.info("HTTP keep-alive: %s", "connection reused" if sock is self._first_socket else "new connection opened")
+        self._first_socket = None
+        self.session.hooks['response'].remove(self._log_connection_reuse)
+        return response
+    
+    def _post_json(self, url: str, obj: Any, headers: Optional[Dict[str, str]] = None,
+                   **kwargs) -> requests.Response:
+        """
+        POST a JSON body, serializing it once up front.
+        
+        Args:
+            url: Request URL
+            obj: JSON-serializable request body
+            headers: Optional per-request headers
+            **kwargs: Extra arguments passed to requests (e.g. timeout)
+            
+        Returns:
+            The requests Response object
+        """
+        headers = {**headers, **_JSON_CONTENT_TYPE} if headers else _JSON_CONTENT_TYPE
+        return self.session.post(url, data=_dumps(obj), headers=headers, **kwargs)
+    
+    def _conditional_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET a JSON resource, revalidating any cached copy with If-None-Match/If-Modified-Since.
+        
+        Args:
+            url: Request URL
+            params: Optional query parameters
+            
+        Returns:
+            Decoded JSON body, served from the cache on 304 Not Modified
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        cached = self._response_cache.get(key)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        response = self.session.get(url, params=params, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            self._response_cache.move_to_end(key)
+            return cached[2]
+        response.raise_for_status()
+        
+        payload = self._json(response)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self._response_cache[key] = (etag, last_modified, payload)
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return payload
+    
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Whether an event loop is running in this thread, where asyncio.run() cannot be used."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+    
+    def _invalidate_backup_cache(self, backup_id: Optional[str]) -> None:
+        """Drop cached backup listings and the metadata entry for one backup."""
+        backups_url = self._u.backups
+        metadata_url = self._u.backup.format(backup_id)
+        for key in [k for k in list(self._response_cache) if k[0] in (backups_url, metadata_url)]:
+            self._response_cache.pop(key, None)
+    
+    @staticmethod
+    def _json(response: requests.Response) -> Any:
+        """Decode a response body (orjson when available); an empty body yields {}."""
+        if not response.content:
+            return {}
+        try:
+            return _loads(response.content)
+        except json.JSONDecodeError as e:
+            # Match response.json() so _api_call still sees a RequestException
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+    
+    def _parse_lazy(self, response: requests.Response) -> Any:
+        """
+        Parse a large response lazily with cysimdjson, decoding values only when accessed.
+        
+        A parser is created per call: cysimdjson documents borrow the parser's buffer,
+        so a shared parser would be overwritten by concurrent requests.
+        Small bodies, or a missing cysimdjson, fall back to a full _json() decode.
+        """
+        if not HAS_CYSIMDJSON or len(response.content) < LAZY_PARSE_MIN_BYTES:
+            return self._json(response)
+        return cysimdjson.JSONParser().parse(response.content)
+    
+    @staticmethod
+    def _unwrap(body: Any, *keys: str) -> Any:
+        """
+        Strip the envelope Veeam wraps around collection responses.
         
+        Args:
+            body: Decoded JSON response
+            *keys: Envelope keys to look for, in order (defaults to 'data')
+            
+        Returns:
+            The first enveloped value found, or the body unchanged
+        """
+        if type(body) is dict:
+            keys = keys or ('data',)
+            for key in keys:
+                value = body.get(key)
+                if value is not None:
+                    return value
+        return body
+    
     def authenticate(self) -> bool:
         """
         Authenticate with the Veeam API and obtain an access token.
@@ -58,9 +540,75 @@ class VeeamDataIntegrationAPI:
         Returns:
             bool: True if authentication successful, False otherwise
         """
+        with self._auth_lock:
+            authenticated = self._authenticate()
+        self._start_token_refresher()
+        return authenticated
+    
+    def _reauthenticate(self, stale_token: Optional[str]) -> None:
+        """
+        Replace an expired token unless another caller already has.
+        
+        Args:
+            stale_token: The token the caller saw rejected
+        """
+        with self._auth_lock:
+            if self.auth_token == stale_token:
+                self._authenticate()
+    
+    def _start_token_refresher(self) -> None:
+        """Start the daemon thread that renews the token before it expires."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._refresh_stop = threading.Event()
+        # The thread only holds a weak reference so discarded clients can be collected
+        self._refresh_thread = threading.Thread(target=self._refresh_loop,
+                                                args=(weakref.ref(self), self._refresh_stop),
+                                                name='veeam-token-refresh', daemon=True)
+        self._refresh_thread.start()
+    
+    def stop_token_refresher(self) -> None:
+        """Stop the background token refresher, e.g. when this client is replaced."""
+        self._refresh_stop.set()
+    
+    @staticmethod
+    def _refresh_loop(api_ref, stop: threading.Event) -> None:
+        """Sleep until the refresh point of the current token, then re-authenticate."""
+        failures = 0
+        while True:
+            api = api_ref()
+            if api is None:
+                return
+            token, delay = api.auth_token, (api._token_expiry - time.time()) * TOKEN_REFRESH_FRACTION
+            del api
+            if stop.wait(max(delay, 1)):
+                return
+            
+            api = api_ref()
+            if api is None:
+                return
+            try:
+                api._reauthenticate(token)
+                failures = 0
+            except Exception as e:
+                failures += 1
+                if isinstance(e, VeeamAPIError):
+                    logger.warning("Background token refresh failed: %s", e)
+                else:
+                    logger.exception("Background token refresh failed unexpectedly")
+            del api
+            
+            if failures >= TOKEN_REFRESH_MAX_FAILURES:
+                logger.error("Giving up background token refresh after %s failed attempts", failures)
+                return
+            if failures and stop.wait(TOKEN_REFRESH_RETRY_DELAY * 2 ** (failures - 1)):
+                return
+    
+    def _authenticate(self) -> bool:
+        """Request a new access token; callers must hold _auth_lock."""
         try:
             # Use the correct Veeam OAuth2 endpoint with API version header
-            auth_url = f"{self.base_url}/api/oauth2/token"
+            auth_url = self._u.auth
             auth_data = {
                 'grant_type': 'password',
                 'username': self.username,
@@ -71,27 +619,23 @@ class VeeamDataIntegrationAPI:
                 'vbr_token': ''
             }
             
-            # Set the correct headers for Veeam API
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
+            # Form-encoded token request; accept/x-api-version come from the session
+            headers = {'Content-Type': 'application/x-www-form-urlencoded'}
             
-            logger.info(f"Attempting authentication to: {auth_url}")
+            logger.info("Attempting authentication to: %s", auth_url)
             response = self.session.post(auth_url, data=auth_data, headers=headers)
             
             # Log response details for debugging
-            logger.info(f"Auth response status: {response.status_code}")
-            logger.info(f"Auth response headers: {dict(response.headers)}")
+            logger.info("Auth response status: %s", response.status_code)
+            logger.info("Auth response headers: %s", response.headers)
             
             if response.status_code == 400:
                 try:
-                    error_data = response.json()
-                    logger.error(f"Authentication failed - Bad Request: {error_data}")
+                    error_data = self._json(response)
+                    logger.error("Authentication failed - Bad Request: %s", error_data)
                     raise VeeamAPIError(f"Authentication failed: {error_data.get('error_description', 'Invalid credentials')}")
                 except json.JSONDecodeError:
-                    logger.error(f"Authentication failed - Bad Request (non-JSON): {response.text}")
+                    logger.error("Authentication failed - Bad Request (non-JSON): %s", response.text)
                     raise VeeamAPIError(f"Authentication failed: Invalid credentials or server configuration")
             elif response.status_code == 401:
                 logger.error("Authentication failed - Unauthorized")
@@ -105,8 +649,9 @@ class VeeamDataIntegrationAPI:
             
             response.raise_for_status()
             
-            auth_result = response.json()
+            auth_result = self._json(response)
             self.auth_token = auth_result.get('access_token')
+            self._token_expiry = time.time() + int(auth_result.get('expires_in', 3600))
             
             if self.auth_token:
                 self.session.headers.update({
@@ -120,15 +665,16 @@ class VeeamDataIntegrationAPI:
                 raise VeeamAPIError("Authentication failed: No access token received")
                 
         except requests.exceptions.ConnectionError as e:
-            logger.error(f"Connection failed: {str(e)}")
+            logger.error("Connection failed: %s", e)
             raise VeeamAPIError(f"Connection failed: Cannot reach Veeam server at {self.base_url}")
         except requests.exceptions.Timeout as e:
-            logger.error(f"Request timeout: {str(e)}")
+            logger.error("Request timeout: %s", e)
             raise VeeamAPIError("Authentication failed: Request timeout")
         except requests.exceptions.RequestException as e:
-            logger.error(f"Authentication failed: {str(e)}")
+            logger.error("Authentication failed: %s", e)
             raise VeeamAPIError(f"Authentication failed: {str(e)}")
     
+    @_api_call("Failed to retrieve backups")
     def get_backups(self, vm_name: Optional[str] = None, 
                    start_date: Optional[datetime] = None,
                    end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
@@ -143,47 +689,26 @@ class VeeamDataIntegrationAPI:
         Returns:
             List of backup information dictionaries
         """
-        try:
-            url = f"{self.base_url}/api/v1/backups"
-            params = {}
-            
-            # Set the correct headers for Veeam API
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
-            
-            if vm_name:
-                params['vmName'] = vm_name
-            if start_date:
-                params['startDate'] = start_date.isoformat()
-            if end_date:
-                params['endDate'] = end_date.isoformat()
-            
-            response = self.session.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            backups_response = response.json()
-            
-            # Handle Veeam API response format - it might be wrapped in a data structure
-            if isinstance(backups_response, dict):
-                if 'data' in backups_response:
-                    backups = backups_response['data']
-                elif 'backups' in backups_response:
-                    backups = backups_response['backups']
-                else:
-                    backups = backups_response
-            else:
-                backups = backups_response
-            
-            logger.info(f"Retrieved {len(backups) if isinstance(backups, list) else 'unknown'} backups from Veeam API")
-            return backups
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to retrieve backups: {str(e)}")
-            raise VeeamAPIError(f"Failed to retrieve backups: {str(e)}")
+        url = self._u.backups
+        params = {}
+        
+        if vm_name:
+            params['vmName'] = vm_name
+        if start_date:
+            params['startDate'] = start_date.isoformat()
+        if end_date:
+            params['endDate'] = end_date.isoformat()
+        
+        backups_response = self._conditional_get(url, params)
+        
+        # Handle Veeam API response format - it might be wrapped in a data structure
+        backups = self._unwrap(backups_response, 'data', 'backups')
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Retrieved %d backups from Veeam API", len(backups))
+        return backups
     
+    @_api_call("Failed to retrieve restore points")
     def get_restore_points(self, backup_id: str = None) -> List[Dict[str, Any]]:
         """
         Get restore points for a specific backup or all restore points.
@@ -194,39 +719,224 @@ class VeeamDataIntegrationAPI:
         Returns:
             List of restore point information dictionaries
         """
-        try:
-            url = f"{self.base_url}/api/v1/restorePoints"
-            params = {}
+        url = self._u.restore_points
+        params = {}
+        
+        if backup_id:
+            params['backupId'] = backup_id
+        
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        
+        restore_points_response = self._json(response)
+        
+        # Handle Veeam API response format
+        restore_points = self._unwrap(restore_points_response, 'data', 'restorePoints')
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Retrieved %d restore points", len(restore_points))
+        return restore_points
+    
+    def _cached_restore_points(self, backup_id: str) -> List[Dict[str, Any]]:
+        """
+        Return restore points for a backup, refetching once the cache entry expires.
+        
+        Args:
+            backup_id: ID of the backup
             
-            if backup_id:
-                params['backupId'] = backup_id
+        Returns:
+            List of restore point information dictionaries
+        """
+        fetched_at = self._restore_point_cache_ts.get(backup_id)
+        if fetched_at is not None and time.monotonic() - fetched_at < RESTORE_POINT_CACHE_TTL:
+            return self._restore_point_cache[backup_id]
+        
+        restore_points = self.get_restore_points(backup_id)
+        self._store_restore_points(backup_id, restore_points)
+        return restore_points
+    
+    def _latest_restore_point(self, backup_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the first restore point listed for a backup.
+        
+        Uses the restore point cache when fresh. Otherwise, with ijson installed,
+        the listing is stream-parsed and the connection dropped after the first item
+        instead of decoding the whole array; the full listing is only fetched if the
+        stream cannot be parsed.
+        
+        Args:
+            backup_id: ID of the backup
             
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
+        Returns:
+            The first restore point dictionary, or None if the backup has none
+        """
+        fetched_at = self._restore_point_cache_ts.get(backup_id)
+        fresh = fetched_at is not None and time.monotonic() - fetched_at < RESTORE_POINT_CACHE_TTL
+        if HAS_IJSON and not fresh:
+            url = self._u.restore_points
+            items = self._iter_items(url, {'backupId': backup_id}, prefix=None)
+            try:
+                # An empty stream means the backup has no restore points
+                return next(items, None)
+            except ijson.JSONError as e:
+                logger.debug("Streaming restore points failed, refetching in full: %s", e)
+            finally:
+                items.close()
+        
+        restore_points = self._cached_restore_points(backup_id)
+        return restore_points[0] if restore_points else None
+    
+    @_api_call("Failed to stream response")
+    def _iter_items(self, url: str, params: Optional[Dict[str, Any]] = None,
+                    prefix: Optional[str] = 'data.item'):
+        """
+        Lazily yield the items of a JSON collection response.
+        
+        Args:
+            url: Request URL
+            params: Optional query parameters
+            prefix: ijson prefix of the items to yield, or None to stream either a
+                bare array or the 'data' envelope, whichever the response holds
             
-            response = self.session.get(url, params=params, headers=headers)
-            response.raise_for_status()
+        Returns:
+            Generator over the decoded items; closing it releases the connection
+        """
+        response = self.session.get(url, params=params, stream=True)
+        response.raise_for_status()
+        response.raw.decode_content = True
+        return self._stream_items(response, prefix)
+    
+    @staticmethod
+    def _stream_items(response: requests.Response, prefix: Optional[str]):
+        """Generator body for _iter_items()."""
+        try:
+            if prefix is not None:
+                yield from ijson.items(response.raw, prefix)
+                return
+            events = ijson.parse(response.raw)
+            first = next(events, None)
+            if first is None:
+                return
+            # Same shapes _unwrap accepts: a bare array, or items under 'data'
+            prefix = 'item' if first[1] == 'start_array' else 'data.item'
+            yield from ijson.items(_replay(first, events), prefix)
+        finally:
+            response.close()
+    
+    def _store_restore_points(self, backup_id: str, restore_points: List[Dict[str, Any]]) -> None:
+        """Record a restore point list in the TTL cache."""
+        self._restore_point_cache[backup_id] = restore_points
+        self._restore_point_cache_ts[backup_id] = time.monotonic()
+    
+    @staticmethod
+    def _index_working_sessions(sessions: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Index 'Working' sessions by backup ID, keeping the first session per backup.
+        
+        Args:
+            sessions: Session dictionaries as returned by get_active_sessions()
             
-            restore_points_response = response.json()
+        Returns:
+            Dictionary mapping backup ID to its first working session
+        """
+        index = {}
+        for session in sessions:
+            backup_id = session.get('backupId')
+            if backup_id is not None and session.get('state') == 'Working':
+                index.setdefault(backup_id, session)
+        return index
+    
+    def _cached_restore_point_id(self, backup_id: str) -> Optional[str]:
+        """Return the remembered restore point ID for a backup while it is within the TTL."""
+        entry = self._rp_cache.get(backup_id)
+        if entry is None:
+            return None
+        restore_point_id, discovered_at = entry
+        if time.monotonic() - discovered_at >= RESTORE_POINT_CACHE_TTL:
+            self._rp_cache.pop(backup_id, None)
+            return None
+        return restore_point_id
+    
+    def refresh_backups(self) -> None:
+        """Forget cached restore points and backup listings so the next calls refetch them."""
+        self._rp_cache.clear()
+        self._restore_point_cache.clear()
+        self._restore_point_cache_ts.clear()
+        self._response_cache.clear()
+    
+    def mount_restore_point(self, restore_point_id: str, backup_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Mount a restore point directly, skipping session and restore point discovery.
+        
+        Args:
+            restore_point_id: ID of the restore point to mount
+            backup_id: ID of the owning backup, recorded on the tracked session (optional)
             
-            # Handle Veeam API response format
-            if isinstance(restore_points_response, dict):
-                if 'data' in restore_points_response:
-                    restore_points = restore_points_response['data']
-                else:
-                    restore_points = restore_points_response
-            else:
-                restore_points = restore_points_response
+        Returns:
+            Dictionary containing mount session information
+        """
+        try:
+            return self._create_mount(backup_id, restore_point_id)
+        except Exception as e:
+            logger.error("Failed to mount restore point %s: %s", restore_point_id, e)
+            raise VeeamAPIError(f"Failed to mount restore point: {str(e)}")
+    
+    def _mount_ready_event(self, backup_id: Optional[str]) -> threading.Event:
+        """Return the readiness event for a backup, creating it on first use."""
+        with self._mount_ready_lock:
+            event = self._mount_ready_events.get(backup_id)
+            if event is None:
+                event = self._mount_ready_events[backup_id] = threading.Event()
+            return event
+    
+    def _clear_mount_ready(self, backup_id: Optional[str]) -> None:
+        """Reset a backup's readiness once its last tracked session is gone."""
+        if self.mount_sessions.session_for_backup(backup_id) is None:
+            self._mount_ready_event(backup_id).clear()
+    
+    def wait_for_mount(self, backup_id: str, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Block until a mount of the backup is ready, without polling the API.
+        
+        Woken directly by mount_backup() (typically running in another thread)
+        once the session is tracked and its UNC path resolved.
+        
+        Args:
+            backup_id: ID of the backup being mounted
+            timeout: Maximum seconds to wait (None waits indefinitely)
             
-            logger.info(f"Retrieved {len(restore_points) if isinstance(restore_points, list) else 'unknown'} restore points")
-            return restore_points
+        Returns:
+            Session ID of the ready mount, or None on timeout
+        """
+        if not self._mount_ready_event(backup_id).wait(timeout):
+            return None
+        return self.mount_sessions.session_for_backup(backup_id)
+    
+    def mount_many(self, backup_ids: List[str]) -> Dict[str, Any]:
+        """
+        Mount several backups, prefetching their restore points concurrently.
+        
+        Args:
+            backup_ids: IDs of the backups to mount
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to retrieve restore points: {str(e)}")
-            raise VeeamAPIError(f"Failed to retrieve restore points: {str(e)}")
+        Returns:
+            Dictionary mapping backup ID to its mount result, or to an
+            {'error': ...} dictionary if that mount failed
+        """
+        if HAS_ASYNC_HTTP and len(backup_ids) > 1 and not self._in_event_loop():
+            try:
+                asyncio.run(self._a_prefetch_restore_points(backup_ids))
+            except VeeamAPIError as e:
+                # Prefetch is an optimization only; mount_backup fetches on miss
+                logger.warning("Restore point prefetch failed: %s", e)
+        
+        results = {}
+        for backup_id in backup_ids:
+            try:
+                results[backup_id] = self.mount_backup(backup_id)
+            except VeeamAPIError as e:
+                results[backup_id] = {'error': str(e)}
+        return results
     
     def mount_backup(self, backup_id: str, mount_point: str = None) -> Dict[str, Any]:
         """
@@ -242,18 +952,19 @@ class VeeamDataIntegrationAPI:
             Dictionary containing mount session information
         """
         try:
-            # First, check if there's already an active session for this backup in Veeam
-            active_sessions = self.get_active_sessions()
-            existing_session = None
+            # Fast path: the restore point is already known and nothing is tracked for this
+            # backup, so skip the session and restore point discovery round-trips
+            restore_point_id = self._cached_restore_point_id(backup_id)
+            if restore_point_id and self.mount_sessions.session_for_backup(backup_id) is None:
+                logger.info("Mounting backup %s from cached restore point %s", backup_id, restore_point_id)
+                return self._create_mount(backup_id, restore_point_id)
             
-            for session in active_sessions:
-                if (session.get('backupId') == backup_id and 
-                    session.get('state') == 'Working'):
-                    existing_session = session
-                    logger.info(f"Found existing session {session['id']} for backup {backup_id}")
-                    break
+            # First, check if there's already an active session for this backup in Veeam
+            working_sessions = self._index_working_sessions(self.get_active_sessions())
+            existing_session = working_sessions.get(backup_id)
             
             if existing_session:
+                logger.info("Found existing session %s for backup %s", existing_session['id'], backup_id)
                 # Use existing session and resolve actual folder name from Veeam
                 session_id = existing_session['id']
                 session_info = existing_session
@@ -277,17 +988,18 @@ class VeeamDataIntegrationAPI:
                 unc_path = self._build_unc_path(session_id, folder_name)
 
                 # Store mount session info with correct UNC path
-                self.mount_sessions[session_id] = {
-                    'backup_id': backup_id,
-                    'restore_point_id': existing_session.get('restorePointId'),
-                    'mount_point': unc_path,
-                    'folder_name': folder_name,
-                    'mounted_at': datetime.utcnow(),
-                    'session_info': session_info,
-                    'mount_type': mount_type
-                }
+                self.mount_sessions[session_id] = MountSession(
+                    backup_id=backup_id,
+                    restore_point_id=existing_session.get('restorePointId'),
+                    mount_point=unc_path,
+                    folder_name=folder_name,
+                    mounted_at=time.time_ns(),
+                    mount_type=mount_type
+                )
                 
-                logger.info(f"Using existing {mount_type} session {session_id} for backup {backup_id}")
+                self._invalidate_backup_cache(backup_id)
+                self._mount_ready_event(backup_id).set()
+                logger.info("Using existing %s session %s for backup %s", mount_type, session_id, backup_id)
                 return {
                     'session_id': session_id,
                     'mount_point': unc_path,
@@ -297,61 +1009,75 @@ class VeeamDataIntegrationAPI:
                 }
             else:
                 # No existing session found, need to get restore points and create new one
-                logger.info(f"No existing FLR session found for backup {backup_id}, getting restore points...")
+                logger.info("No existing FLR session found for backup %s, getting restore points...", backup_id)
                 
-                # Get restore points for this backup
-                restore_points = self.get_restore_points(backup_id)
-                if not restore_points:
+                # Use the most recent restore point (assuming they're sorted by creation time)
+                latest_restore_point = self._latest_restore_point(backup_id)
+                if latest_restore_point is None:
                     raise VeeamAPIError(f"No restore points found for backup {backup_id}")
                 
-                # Use the most recent restore point
-                latest_restore_point = restore_points[0]  # Assuming they're sorted by creation time
                 restore_point_id = latest_restore_point.get('id')
                 
                 if not restore_point_id:
                     raise VeeamAPIError(f"No valid restore point ID found for backup {backup_id}")
                 
-                logger.info(f"Creating new ISCSI Windows mount for restore point {restore_point_id}")
-                flr_session = self.create_flr_session_for_restore_point(restore_point_id)
-                
-                # The API returns 'sessionId' field, not 'id'
-                session_id = flr_session.get('sessionId') or flr_session.get('id')
-                
-                if session_id:
-                    # Resolve actual folder name (Data Integration details -> logs -> fallback)
-                    folder_name = self._get_folder_name_from_data_integration(session_id)
-                    if not folder_name:
-                        folder_name = self._get_folder_name_from_session_logs(session_id)
-                    if not folder_name:
-                        folder_name = f"target_{session_id[:8]}"
-                    
-                    # Store mount session info with correct UNC path (with admin share)
-                    unc_path = self._build_unc_path(session_id, folder_name)
-                    self.mount_sessions[session_id] = {
-                        'backup_id': backup_id,
-                        'restore_point_id': restore_point_id,
-                        'mount_point': unc_path,
-                        'folder_name': folder_name,
-                        'mounted_at': datetime.utcnow(),
-                        'session_info': flr_session,
-                        'mount_type': 'ISCSI'
-                    }
-                    
-                    logger.info(f"Successfully created new ISCSI session {session_id} with folder {folder_name} for backup {backup_id}")
-                    return {
-                        'session_id': session_id,
-                        'mount_point': unc_path,
-                        'mount_type': 'ISCSI',
-                        'status': 'mounted',
-                        'session_info': flr_session
-                    }
-                else:
-                    raise VeeamAPIError("Failed to create FLR session - no session ID returned")
+                self._rp_cache[backup_id] = (restore_point_id, time.monotonic())
+                return self._create_mount(backup_id, restore_point_id)
                 
         except Exception as e:
-            logger.error(f"Failed to mount backup {backup_id}: {str(e)}")
+            logger.error("Failed to mount backup %s: %s", backup_id, e)
             raise VeeamAPIError(f"Failed to mount backup: {str(e)}")
     
+    def _create_mount(self, backup_id: Optional[str], restore_point_id: str) -> Dict[str, Any]:
+        """
+        Create a new mount session for a known restore point and track it.
+        
+        Args:
+            backup_id: ID of the backup the restore point belongs to, if known
+            restore_point_id: ID of the restore point to mount
+            
+        Returns:
+            Dictionary containing mount session information
+        """
+        logger.info("Creating new ISCSI Windows mount for restore point %s", restore_point_id)
+        flr_session = self.create_flr_session_for_restore_point(restore_point_id)
+        
+        # The API returns 'sessionId' field, not 'id'
+        session_id = flr_session.get('sessionId') or flr_session.get('id')
+        
+        if session_id:
+            # Resolve actual folder name (Data Integration details -> logs -> fallback)
+            folder_name = self._get_folder_name_from_data_integration(session_id)
+            if not folder_name:
+                folder_name = self._get_folder_name_from_session_logs(session_id)
+            if not folder_name:
+                folder_name = f"target_{session_id[:8]}"
+            
+            # Store mount session info with correct UNC path (with admin share)
+            unc_path = self._build_unc_path(session_id, folder_name)
+            self.mount_sessions[session_id] = MountSession(
+                backup_id=backup_id,
+                restore_point_id=restore_point_id,
+                mount_point=unc_path,
+                folder_name=folder_name,
+                mounted_at=time.time_ns(),
+                mount_type='ISCSI'
+            )
+            
+            self._invalidate_backup_cache(backup_id)
+            self._mount_ready_event(backup_id).set()
+            logger.info("Successfully created new ISCSI session %s with folder %s for backup %s", session_id, folder_name, backup_id)
+            return {
+                'session_id': session_id,
+                'mount_point': unc_path,
+                'mount_type': 'ISCSI',
+                'status': 'mounted',
+                'session_info': flr_session
+            }
+        else:
+            raise VeeamAPIError("Failed to create FLR session - no session ID returned")
+    
+    @_api_call("Failed to retrieve mount sessions")
     def get_mount_sessions(self) -> List[Dict[str, Any]]:
         """
         Get all active Data Integration mount sessions.
@@ -359,33 +1085,20 @@ class VeeamDataIntegrationAPI:
         Returns:
             List of mount session information dictionaries
         """
-        try:
-            url = f"{self.base_url}/api/v1/dataIntegration"
-            
-            # Set the correct headers for Veeam API
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
-            
-            response = self.session.get(url, headers=headers)
-            response.raise_for_status()
-            
-            response_data = response.json()
-            # Handle paginated response structure
-            if 'data' in response_data:
-                sessions = response_data['data']
-                logger.info(f"Retrieved {len(sessions)} active mount sessions (total: {response_data.get('pagination', {}).get('total', len(sessions))})")
-            else:
-                sessions = response_data
-                logger.info(f"Retrieved {len(sessions)} active mount sessions")
-            return sessions
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to retrieve mount sessions: {str(e)}")
-            raise VeeamAPIError(f"Failed to retrieve mount sessions: {str(e)}")
+        url = self._u.data_integration
+        
+        response = self.session.get(url)
+        response.raise_for_status()
+        
+        response_data = self._json(response)
+        # Handle paginated response structure
+        sessions = self._unwrap(response_data)
+        if logger.isEnabledFor(logging.INFO):
+            total = response_data.get('pagination', {}).get('total', len(sessions)) if sessions is not response_data else len(sessions)
+            logger.info("Retrieved %d active mount sessions (total: %s)", len(sessions), total)
+        return sessions
     
+    @_api_call("Failed to retrieve mount session details")
     def get_mount_session_details(self, session_id: str) -> Dict[str, Any]:
         """
         Get detailed information about a specific mount session.
@@ -396,26 +1109,16 @@ class VeeamDataIntegrationAPI:
         Returns:
             Dictionary containing detailed mount session information
         """
-        try:
-            url = f"{self.base_url}/api/v1/dataIntegration/{session_id}"
-            
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
-            
-            response = self.session.get(url, headers=headers)
-            response.raise_for_status()
-            
-            session_details = response.json()
-            logger.info(f"Retrieved details for mount session {session_id}")
-            return session_details
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to retrieve mount session details: {str(e)}")
-            raise VeeamAPIError(f"Failed to retrieve mount session details: {str(e)}")
+        url = self._u.data_integration_session.format(session_id)
+        
+        response = self.session.get(url)
+        response.raise_for_status()
+        
+        session_details = self._json(response)
+        logger.info("Retrieved details for mount session %s", session_id)
+        return session_details
     
+    @_api_call("Failed to create FLR session")
     def create_flr_session(self, restore_point_id: str) -> Dict[str, Any]:
         """
         Create a File Level Restore session for file browsing.
@@ -426,36 +1129,25 @@ class VeeamDataIntegrationAPI:
         Returns:
             Dictionary containing FLR session information
         """
-        try:
-            url = f"{self.base_url}/api/v1/restore/flr"
-            flr_data = {
-                'restorePointId': restore_point_id,
-                'type': 'Windows',
-                'autoUnmount': {
-                    'isEnabled': True,
-                    'noActivityPeriodInMinutes': 5  # Short timeout for scanning
-                },
-                'reason': 'File browsing for ML analysis'
-            }
-            
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            response = self.session.post(url, json=flr_data, headers=headers)
-            response.raise_for_status()
-            
-            flr_session = response.json()
-            logger.info(f"Created FLR session {flr_session.get('id')} for file browsing")
-            return flr_session
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to create FLR session: {str(e)}")
-            raise VeeamAPIError(f"Failed to create FLR session: {str(e)}")
+        url = self._u.flr
+        flr_data = {
+            'restorePointId': restore_point_id,
+            'type': 'Windows',
+            'autoUnmount': {
+                'isEnabled': True,
+                'noActivityPeriodInMinutes': 5  # Short timeout for scanning
+            },
+            'reason': 'File browsing for ML analysis'
+        }
+        
+        response = self._post_json(url, flr_data)
+        response.raise_for_status()
+        
+        flr_session = self._json(response)
+        logger.info("Created FLR session %s for file browsing", flr_session.get('id'))
+        return flr_session
     
+    @_api_call("Failed to browse FLR files")
     def browse_flr_files(self, session_id: str, directory_path: str = '/') -> List[Dict[str, Any]]:
         """
         Browse files in a FLR session (legacy method for backward compatibility).
@@ -467,29 +1159,19 @@ class VeeamDataIntegrationAPI:
         Returns:
             List of file information dictionaries
         """
-        try:
-            url = f"{self.base_url}/api/v1/backupBrowser/flr/{session_id}/files"
-            params = {'path': directory_path}
-            
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
-            
-            response = self.session.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            files_response = response.json()
-            files = files_response.get('data', [])
-            
-            logger.info(f"Found {len(files)} files in {directory_path}")
-            return files
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to browse FLR files: {str(e)}")
-            raise VeeamAPIError(f"Failed to browse FLR files: {str(e)}")
+        url = self._u.flr_files.format(session_id)
+        params = {'path': directory_path}
+        
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        
+        files_response = self._json(response)
+        files = files_response.get('data', [])
+        
+        logger.info("Found %d files in %s", len(files), directory_path)
+        return files
     
+    @_api_call("Failed to browse NAS unstructured data")
     def browse_nas_unstructured_data(self, session_id: str, directory_path: str = '/') -> List[Dict[str, Any]]:
         """
         Browse unstructured data in NAS FLR session.
@@ -501,29 +1183,21 @@ class VeeamDataIntegrationAPI:
         Returns:
             List of file information dictionaries
         """
-        try:
-            url = f"{self.base_url}/api/v1/backupBrowser/flr/unstructuredData/{session_id}/files"
-            params = {'path': directory_path}
-            
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev1',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
-            
-            response = self.session.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            files_response = response.json()
-            files = files_response.get('data', [])
-            
-            logger.info(f"Found {len(files)} unstructured files in {directory_path}")
-            return files
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to browse NAS unstructured data: {str(e)}")
-            raise VeeamAPIError(f"Failed to browse NAS unstructured data: {str(e)}")
+        url = self._u.flr_unstructured_files.format(session_id)
+        params = {'path': directory_path}
+        
+        headers = {'x-api-version': '1.2-rev1'}
+        
+        response = self.session.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        
+        files_response = self._json(response)
+        files = files_response.get('data', [])
+        
+        logger.info("Found %d unstructured files in %s", len(files), directory_path)
+        return files
 
+    @_api_call("Failed to get compare attributes")
     def get_file_compare_attributes(self, session_id: str, file_path: str) -> Dict[str, Any]:
         """
         Get extended file attributes for comparison (readonly, hidden, encryption).
@@ -535,26 +1209,17 @@ class VeeamDataIntegrationAPI:
         Returns:
             Dictionary containing extended file attributes
         """
-        try:
-            url = f"{self.base_url}/api/v1/backupBrowser/flr/{session_id}/compareAttributes"
-            params = {'path': file_path}
-            
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev1',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
-            
-            response = self.session.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            attributes = response.json()
-            logger.info(f"Retrieved compare attributes for {file_path}")
-            return attributes
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get compare attributes for {file_path}: {str(e)}")
-            raise VeeamAPIError(f"Failed to get compare attributes: {str(e)}")
+        url = self._u.flr_compare.format(session_id)
+        params = {'path': file_path}
+        
+        headers = {'x-api-version': '1.2-rev1'}
+        
+        response = self.session.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        
+        attributes = self._json(response)
+        logger.info("Retrieved compare attributes for %s", file_path)
+        return attributes
 
     def extract_file_system_metadata(self, session_id: str, mount_type: str = 'FLR', 
                                    max_depth: int = 3, include_attributes: bool = False) -> Dict[str, Any]:
@@ -597,13 +1262,13 @@ class VeeamDataIntegrationAPI:
             self._scan_directory_metadata(session_id, '/', browse_method, metadata, 
                                         max_depth, 0, include_attributes)
             
-            logger.info(f"Extracted metadata for {metadata['statistics']['total_files']} files, "
-                       f"{metadata['statistics']['total_directories']} directories")
+            logger.info("Extracted metadata for %s files, %s directories",
+                        metadata['statistics']['total_files'], metadata['statistics']['total_directories'])
             
             return metadata
             
         except Exception as e:
-            logger.error(f"Failed to extract file system metadata: {str(e)}")
+            logger.error("Failed to extract file system metadata: %s", e)
             raise VeeamAPIError(f"Failed to extract file system metadata: {str(e)}")
 
     def _scan_directory_metadata(self, session_id: str, directory_path: str, 
@@ -648,7 +1313,7 @@ class VeeamDataIntegrationAPI:
                         attributes = self.get_file_compare_attributes(session_id, file_data['path'])
                         file_data['attributes'] = attributes
                     except Exception as e:
-                        logger.debug(f"Failed to get attributes for {file_data['path']}: {str(e)}")
+                        logger.debug("Failed to get attributes for %s: %s", file_data['path'], e)
                         file_data['attributes'] = None
                 
                 # Update statistics
@@ -671,7 +1336,7 @@ class VeeamDataIntegrationAPI:
                                                 metadata, max_depth, current_depth + 1, include_attributes)
                     
         except Exception as e:
-            logger.warning(f"Failed to scan directory {directory_path}: {str(e)}")
+            logger.warning("Failed to scan directory %s: %s", directory_path, e)
 
     def _classify_file_type(self, filename: str) -> str:
         """
@@ -683,48 +1348,7 @@ class VeeamDataIntegrationAPI:
         Returns:
             File type category
         """
-        ext = os.path.splitext(filename)[1].lower()
-        
-        # Document types
-        if ext in ['.pdf', '.doc', '.docx', '.txt', '.rtf']:
-            return 'document'
-        elif ext in ['.xls', '.xlsx', '.csv']:
-            return 'spreadsheet'
-        elif ext in ['.ppt', '.pptx']:
-            return 'presentation'
-        
-        # Database types
-        elif ext in ['.mdf', '.ldf', '.ndf']:
-            return 'sqlserver_db'
-        elif ext in ['.dbf', '.ora']:
-            return 'oracle_db'
-        elif ext in ['.sqlite', '.db', '.sqlite3']:
-            return 'sqlite_db'
-        elif ext in ['.sql', '.dump']:
-            return 'sql_dump'
-        
-        # Log and config files
-        elif ext in ['.log', '.txt']:
-            return 'log'
-        elif ext in ['.ini', '.cfg', '.conf', '.config', '.xml', '.json', '.yaml', '.yml']:
-            return 'config'
-        
-        # Media files
-        elif ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']:
-            return 'image'
-        elif ext in ['.mp3', '.wav', '.flac', '.aac']:
-            return 'audio'
-        elif ext in ['.mp4', '.avi', '.mkv', '.mov', '.wmv']:
-            return 'video'
-        
-        # Executable and system files
-        elif ext in ['.exe', '.dll', '.sys']:
-            return 'executable'
-        elif ext in ['.zip', '.rar', '.7z', '.tar', '.gz']:
-            return 'archive'
-        
-        else:
-            return 'unknown'
+        return _EXT_CATEGORY.get(os.path.splitext(filename)[1].lower(), 'unknown')
 
     def _is_extractable_for_ml(self, filename: str, is_directory: bool) -> bool:
         """
@@ -740,15 +1364,7 @@ class VeeamDataIntegrationAPI:
         if is_directory:
             return False
         
-        file_type = self._classify_file_type(filename)
-        
-        # Files suitable for ML extraction
-        extractable_types = {
-            'document', 'spreadsheet', 'presentation', 'log', 'config',
-            'sqlite_db', 'sql_dump', 'json', 'xml', 'csv'
-        }
-        
-        return file_type in extractable_types
+        return self._classify_file_type(filename) in _ML_EXTRACTABLE_TYPES
     
     def cleanup_flr_session(self, session_id: str) -> bool:
         """
@@ -761,24 +1377,19 @@ class VeeamDataIntegrationAPI:
             bool: True if cleanup successful
         """
         try:
-            url = f"{self.base_url}/api/v1/restore/flr/{session_id}/unmount"
-            
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
+            url = self._u.flr_unmount.format(session_id)
             
-            response = self.session.post(url, headers=headers)
+            response = self.session.post(url)
             response.raise_for_status()
             
-            logger.info(f"Cleaned up FLR session {session_id}")
+            logger.info("Cleaned up FLR session %s", session_id)
             return True
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to cleanup FLR session {session_id}: {str(e)}")
+            logger.error("Failed to cleanup FLR session %s: %s", session_id, e)
             return False
     
+    @_api_call("Failed to create Windows FLR session")
     def mount_windows_backup_flr(self, restore_point_id: str) -> Dict[str, Any]:
         """
         Mount a Windows backup using File Level Restore (FLR).
@@ -790,56 +1401,43 @@ class VeeamDataIntegrationAPI:
         Returns:
             Dictionary containing FLR session information
         """
-        try:
-            # Use FLR API for Windows backups
-            url = f"{self.base_url}/api/v1/restore/flr"
-            flr_data = {
-                'restorePointId': restore_point_id,
-                'type': 'Windows',
-                'autoUnmount': {
-                    'isEnabled': True,
-                    'noActivityPeriodInMinutes': 30  # Longer timeout for file access
-                },
-                'reason': 'File Level Restore for ML analysis'
-            }
-            
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            response = self.session.post(url, json=flr_data, headers=headers)
-            response.raise_for_status()
-            
-            flr_session = response.json()
-            # The API returns 'sessionId' field, not 'id'
-            session_id = flr_session.get('sessionId') or flr_session.get('id')
-            
-            if session_id:
-                # Construct the actual folder name used by Veeam
-                # Format: {machineName}_{first8CharsOfSessionId}
-                machine_name = flr_session.get('sourceProperties', {}).get('machineName', 'unknown')
-                abbreviated_id = session_id[:8]
-                folder_name = f"{machine_name}_{abbreviated_id}"
-                
-                # Store FLR session info with correct UNC path
-                self.mount_sessions[session_id] = {
-                    'backup_id': restore_point_id,
-                    'mount_point': f"\\\\{self.mount_server_name}\\VeeamFLR\\{folder_name}",
-                    'folder_name': folder_name,
-                    'mounted_at': datetime.utcnow(),
-                    'session_info': flr_session,
-                    'mount_type': 'FLR'
-                }
-                logger.info(f"Successfully created Windows FLR session {session_id} with folder {folder_name}")
-            
-            return flr_session
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to create Windows FLR session: {str(e)}")
-            raise VeeamAPIError(f"Failed to create Windows FLR session: {str(e)}")
+        # Use FLR API for Windows backups
+        url = self._u.flr
+        flr_data = {
+            'restorePointId': restore_point_id,
+            'type': 'Windows',
+            'autoUnmount': {
+                'isEnabled': True,
+                'noActivityPeriodInMinutes': 30  # Longer timeout for file access
+            },
+            'reason': 'File Level Restore for ML analysis'
+        }
+        
+        response = self._post_json(url, flr_data)
+        response.raise_for_status()
+        
+        flr_session = self._json(response)
+        # The API returns 'sessionId' field, not 'id'
+        session_id = flr_session.get('sessionId') or flr_session.get('id')
+        
+        if session_id:
+            # Construct the actual folder name used by Veeam
+            # Format: {machineName}_{first8CharsOfSessionId}
+            machine_name = flr_session.get('sourceProperties', {}).get('machineName', 'unknown')
+            abbreviated_id = session_id[:8]
+            folder_name = f"{machine_name}_{abbreviated_id}"
+            
+            # Store FLR session info with correct UNC path
+            self.mount_sessions[session_id] = MountSession(
+                backup_id=restore_point_id,
+                mount_point=f"\\\\{self.mount_server_name}\\VeeamFLR\\{folder_name}",
+                folder_name=folder_name,
+                mounted_at=time.time_ns(),
+                mount_type='FLR'
+            )
+            logger.info("Successfully created Windows FLR session %s with folder %s", session_id, folder_name)
+        
+        return flr_session
     
     def get_flr_mount_points(self, session_id: str) -> List[str]:
         """
@@ -854,18 +1452,12 @@ class VeeamDataIntegrationAPI:
         """
         try:
             # Get FLR session details
-            url = f"{self.base_url}/api/v1/restore/flr/{session_id}"
+            url = self._u.flr_session.format(session_id)
             
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
-            
-            response = self.session.get(url, headers=headers)
+            response = self.session.get(url)
             response.raise_for_status()
             
-            session_details = response.json()
+            session_details = self._json(response)
             
             # Extract mount points from FLR session
             mount_points = []
@@ -878,11 +1470,11 @@ class VeeamDataIntegrationAPI:
             if not mount_points:
                 mount_points = [f"C:\\VeeamFLR\\{session_id}"]
             
-            logger.info(f"FLR session {session_id} mount points: {mount_points}")
+            logger.info("FLR session %s mount points: %s", session_id, mount_points)
             return mount_points
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get FLR mount points: {str(e)}")
+            logger.error("Failed to get FLR mount points: %s", e)
             # Return default path if we can't get details
             return [f"C:\\VeeamFLR\\{session_id}"]
     
@@ -899,12 +1491,11 @@ class VeeamDataIntegrationAPI:
         try:
             # Check if we have this session in our tracking
             if session_id not in self.mount_sessions:
-                logger.warning(f"Mount session {session_id} not found in local tracking")
+                logger.warning("Mount session %s not found in local tracking", session_id)
                 # Try to unmount anyway using FLR API first, then Data Integration
                 return self._try_unmount_flr(session_id) or self._try_unmount_data_integration(session_id)
             
-            mount_info = self.mount_sessions[session_id]
-            mount_type = mount_info.get('mount_type', 'FLR')
+            mount_type = self.mount_sessions[session_id].mount_type
             
             success = False
             if mount_type == 'FLR':
@@ -916,45 +1507,39 @@ class VeeamDataIntegrationAPI:
             
             if success:
                 # Remove from local tracking
-                del self.mount_sessions[session_id]
-                logger.info(f"Successfully unmounted {mount_type} session {session_id}")
+                backup_id = self.mount_sessions.pop(session_id).backup_id
+                self._invalidate_backup_cache(backup_id)
+                self._invalidate_fs_cache(session_id)
+                self._clear_mount_ready(backup_id)
+                logger.info("Successfully unmounted %s session %s", mount_type, session_id)
             
             return success
             
         except Exception as e:
-            logger.error(f"Failed to unmount session {session_id}: {str(e)}")
+            logger.error("Failed to unmount session %s: %s", session_id, e)
             return False
     
     def _try_unmount_flr(self, session_id: str) -> bool:
         """Try to unmount using FLR API."""
         try:
-            url = f"{self.base_url}/api/v1/restore/flr/{session_id}/unmount"
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev1',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
+            url = self._u.flr_unmount.format(session_id)
+            headers = {'x-api-version': '1.2-rev1'}
             response = self.session.post(url, headers=headers, timeout=30)
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
-            logger.debug(f"FLR unmount failed for {session_id}: {str(e)}")
+            logger.debug("FLR unmount failed for %s: %s", session_id, e)
             return False
     
     def _try_unmount_data_integration(self, session_id: str) -> bool:
         """Try to unmount using Data Integration API."""
         try:
-            url = f"{self.base_url}/api/v1/dataIntegration/{session_id}/unpublish"
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
-            response = self.session.post(url, headers=headers, timeout=30)
+            url = self._u.data_integration_unpublish.format(session_id)
+            response = self.session.post(url, timeout=30)
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
-            logger.debug(f"Data Integration unmount failed for {session_id}: {str(e)}")
+            logger.debug("Data Integration unmount failed for %s: %s", session_id, e)
             return False
     
     def get_active_sessions(self) -> List[Dict[str, Any]]:
@@ -966,24 +1551,20 @@ class VeeamDataIntegrationAPI:
         """
         try:
             # Get all sessions
-            url = f"{self.base_url}/api/v1/sessions"
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev1',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
+            url = self._u.sessions
+            headers = {'x-api-version': '1.2-rev1'}
             
-            # Get FLR sessions
-            flr_params = {'typeFilter': 'FileLevelRestore'}
-            flr_response = self.session.get(url, params=flr_params, headers=headers, timeout=30)
-            flr_response.raise_for_status()
-            flr_sessions = flr_response.json().get('data', [])
+            def fetch_sessions(type_filter: str) -> List[Dict[str, Any]]:
+                response = self.session.get(url, params={'typeFilter': type_filter}, headers=headers, timeout=30)
+                response.raise_for_status()
+                return self._json(response).get('data', [])
             
-            # Get Data Integration sessions
-            di_params = {'typeFilter': 'PublishBackupContentViaMount'}
-            di_response = self.session.get(url, params=di_params, headers=headers, timeout=30)
-            di_response.raise_for_status()
-            di_sessions = di_response.json().get('data', [])
+            # The FLR and Data Integration listings are independent, so overlap them:
+            # FLR on a worker thread while Data Integration runs here
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                flr_future = executor.submit(fetch_sessions, 'FileLevelRestore')
+                di_sessions = fetch_sessions('PublishBackupContentViaMount')
+                flr_sessions = flr_future.result()
             
             # Combine and format sessions, marking their source
             all_sessions = []
@@ -1039,11 +1620,11 @@ class VeeamDataIntegrationAPI:
                 else:
                     session_info['is_ready'] = False
             
-            logger.info(f"Retrieved {len(all_sessions)} active sessions")
+            logger.info("Retrieved %d active sessions", len(all_sessions))
             return all_sessions
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get active sessions: {str(e)}")
+            logger.error("Failed to get active sessions: %s", e)
             return []
     
     def _determine_session_type(self, session: Dict[str, Any]) -> str:
@@ -1082,30 +1663,26 @@ class VeeamDataIntegrationAPI:
             True if session is ready for browsing, False otherwise
         """
         try:
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev1',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
+            headers = {'x-api-version': '1.2-rev1'}
             
             # Try to browse files in the session
-            browse_url = f"{self.base_url}/api/v1/backupBrowser/flr/{session_id}/files"
+            browse_url = self._u.flr_files.format(session_id)
             browse_params = {'path': '/'}
             browse_response = self.session.get(browse_url, params=browse_params, headers=headers, timeout=10)
             
             if browse_response.status_code == 200:
-                logger.info(f"FLR session {session_id} is ready for REST API browsing")
+                logger.info("FLR session %s is ready for REST API browsing", session_id)
                 return True
             elif browse_response.status_code == 404:
                 # 404 might mean the session is still initializing, but UNC path could be ready
-                logger.debug(f"FLR session {session_id} REST API not ready (HTTP 404), but UNC path might be accessible")
+                logger.debug("FLR session %s REST API not ready (HTTP 404), but UNC path might be accessible", session_id)
                 return False
             else:
-                logger.debug(f"FLR session {session_id} not ready yet (HTTP {browse_response.status_code})")
+                logger.debug("FLR session %s not ready yet (HTTP %s)", session_id, browse_response.status_code)
             return False
                 
         except Exception as e:
-            logger.debug(f"Error checking FLR session {session_id} readiness: {str(e)}")
+            logger.debug("Error checking FLR session %s readiness: %s", session_id, e)
             return False
 
     def check_unc_path_accessible(self, session_id: str) -> bool:
@@ -1133,22 +1710,22 @@ class VeeamDataIntegrationAPI:
                 try:
                     # Try to access the UNC path using Python's os module
                     files = os.listdir(unc_path)
-                    logger.info(f"UNC path {unc_path} is accessible - found {len(files)} items")
+                    logger.info("UNC path %s is accessible - found %d items", unc_path, len(files))
                     return True
                 except (OSError, PermissionError) as e:
-                    logger.debug(f"UNC path {unc_path} not accessible: {str(e)}")
+                    logger.debug("UNC path %s not accessible: %s", unc_path, e)
                     continue
             
             # If direct UNC access fails, check if we're on Windows and the session is "Working"
             # In this case, assume the UNC path is accessible even if Python can't access it
             if platform.system() == "Windows":
-                logger.info(f"UNC path access failed via Python, but session {session_id} is Working - assuming accessible")
+                logger.info("UNC path access failed via Python, but session %s is Working - assuming accessible", session_id)
                 return True
                 
             return False
                 
         except Exception as e:
-            logger.debug(f"Error checking UNC path accessibility: {str(e)}")
+            logger.debug("Error checking UNC path accessibility: %s", e)
             return False
 
     def wait_for_flr_session_ready(self, session_id: str, max_wait_time: int = 300, check_interval: int = 10) -> bool:
@@ -1165,18 +1742,18 @@ class VeeamDataIntegrationAPI:
         """
         import time
         
-        logger.info(f"Waiting for FLR session {session_id} to be ready...")
+        logger.info("Waiting for FLR session %s to be ready...", session_id)
         start_time = time.time()
         
         while time.time() - start_time < max_wait_time:
             if self._check_flr_session_ready(session_id):
-                logger.info(f"FLR session {session_id} is now ready!")
+                logger.info("FLR session %s is now ready!", session_id)
                 return True
             
-            logger.info(f"FLR session {session_id} not ready yet, waiting {check_interval}s...")
+            logger.info("FLR session %s not ready yet, waiting %ss...", session_id, check_interval)
             time.sleep(check_interval)
         
-        logger.warning(f"FLR session {session_id} did not become ready within {max_wait_time}s")
+        logger.warning("FLR session %s did not become ready within %ss", session_id, max_wait_time)
         return False
 
     def reconcile_mount_state(self) -> Dict[str, Any]:
@@ -1197,29 +1774,28 @@ class VeeamDataIntegrationAPI:
             
             # Remove orphaned sessions
             for session_id in orphaned_sessions:
-                logger.info(f"Removing orphaned session {session_id}")
-                del self.mount_sessions[session_id]
+                logger.info("Removing orphaned session %s", session_id)
+                self._clear_mount_ready(self.mount_sessions.pop(session_id).backup_id)
             
             # Update local sessions with server state
             for session in active_sessions:
                 session_id = session['id']
                 if session_id in self.mount_sessions:
                     # Update existing session info
-                    self.mount_sessions[session_id].update({
-                        'state': session['state'],
-                        'mount_point': session['mount_point'],
-                        'mount_type': session['mount_type']
-                    })
+                    mount_session = self.mount_sessions[session_id]
+                    mount_session.state = session['state']
+                    mount_session.mount_point = session['mount_point']
+                    mount_session.mount_type = session['mount_type']
                 else:
                     # Add new session from server
-                    self.mount_sessions[session_id] = {
-                        'backup_id': session.get('backupId'),
-                        'restore_point_id': session.get('restorePointId'),
-                        'mount_point': session['mount_point'],
-                        'mounted_at': datetime.utcnow(),
-                        'state': session['state'],
-                        'mount_type': session['mount_type']
-                    }
+                    self.mount_sessions[session_id] = MountSession(
+                        backup_id=session.get('backupId'),
+                        restore_point_id=session.get('restorePointId'),
+                        mount_point=session['mount_point'],
+                        mounted_at=time.time_ns(),
+                        state=session['state'],
+                        mount_type=session['mount_type']
+                    )
             
             reconciliation_result = {
                 'total_active_sessions': len(active_sessions),
@@ -1228,13 +1804,14 @@ class VeeamDataIntegrationAPI:
                 'sessions_updated': len(active_sessions)
             }
             
-            logger.info(f"Mount state reconciled: {reconciliation_result}")
+            logger.info("Mount state reconciled: %s", reconciliation_result)
             return reconciliation_result
             
         except Exception as e:
-            logger.error(f"Failed to reconcile mount state: {str(e)}")
+            logger.error("Failed to reconcile mount state: %s", e)
             return {'error': str(e)}
     
+    @_api_call("Failed to get mount status")
     def get_mount_status(self, session_id: str) -> Dict[str, Any]:
         """
         Get the status of a mount session.
@@ -1245,52 +1822,84 @@ class VeeamDataIntegrationAPI:
         Returns:
             Dictionary containing mount session status
         """
-        try:
-            url = f"{self.base_url}/api/v1.2-rev0/mount-sessions/{session_id}"
-            response = self.session.get(url)
-            response.raise_for_status()
-            
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get mount status for session {session_id}: {str(e)}")
-            raise VeeamAPIError(f"Failed to get mount status: {str(e)}")
+        url = self._u.mount_session.format(session_id)
+        response = self.session.get(url)
+        response.raise_for_status()
+        
+        return self._json(response)
     
-    def list_files(self, session_id: str, path: str = "/") -> List[Dict[str, Any]]:
+    @_api_call("Failed to list files")
+    def list_files(self, session_id: str, path: str = "/", materialize: bool = True) -> List[Dict[str, Any]]:
         """
         List files and directories in a mounted backup.
         
         Args:
             session_id: ID of the mount session
             path: Path within the mounted backup to list
+            materialize: Return plain Python objects. With False, large responses
+                are returned as a lazy cysimdjson element when cysimdjson is installed
             
         Returns:
             List of file/directory information dictionaries
         """
-        try:
-            url = f"{self.base_url}/api/v1/mount-sessions/{session_id}/files"
-            params = {'path': path}
-            
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            return response.json()
+        url = self._u.mount_session_files.format(session_id)
+        params = {'path': path}
+        
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        
+        if not materialize:
+            return self._parse_lazy(response)
+        return self._json(response)
+    
+    def iter_files(self, session_id: str, path: str = "/"):
+        """
+        Iterate the entries of a mounted backup directory without materializing the listing.
+        
+        With ijson installed the response is parsed incrementally from the socket, so
+        memory stays flat for directories with tens of thousands of entries; otherwise
+        this falls back to list_files().
+        
+        Args:
+            session_id: ID of the mount session
+            path: Path within the mounted backup to list
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to list files in path {path}: {str(e)}")
-            raise VeeamAPIError(f"Failed to list files: {str(e)}")
+        Returns:
+            Iterator over file/directory information dictionaries
+        """
+        if not HAS_IJSON:
+            return iter(self._unwrap(self.list_files(session_id, path)))
+        url = self._u.mount_session_files.format(session_id)
+        return self._iter_items(url, {'path': path}, prefix=None)
     
     def cleanup_all_mounts(self) -> None:
         """
         Cleanup all active mount sessions.
         Should be called when shutting down the application.
         """
-        for session_id in list(self.mount_sessions.keys()):
-            try:
-                self.unmount_backup(session_id)
-            except Exception as e:
-                logger.error(f"Failed to cleanup mount session {session_id}: {str(e)}")
+        if HAS_ASYNC_HTTP and self.mount_sessions and not self._in_event_loop():
+            # Fan the unmount POSTs out concurrently instead of one RTT each
+            asyncio.run(self._a_cleanup_all_mounts())
+            return
+        
+        session_ids = list(self.mount_sessions.keys())
+        if not session_ids:
+            return
+        
+        # requests.Session is safe for concurrent independent requests; the pool
+        # (HTTP_POOL_MAXSIZE) is larger than the worker count so calls do not queue
+        with ThreadPoolExecutor(max_workers=min(CLEANUP_MAX_WORKERS, len(session_ids))) as executor:
+            list(executor.map(self._safe_unmount, session_ids))
     
+    def _safe_unmount(self, session_id: str) -> bool:
+        """Unmount a session, logging instead of raising on failure."""
+        try:
+            return self.unmount_backup(session_id)
+        except Exception as e:
+            logger.error("Failed to cleanup mount session %s: %s", session_id, e)
+            return False
+    
+    @_api_call("Failed to get backup metadata")
     def get_backup_metadata(self, backup_id: str) -> Dict[str, Any]:
         """
         Get detailed metadata about a specific backup.
@@ -1301,17 +1910,10 @@ class VeeamDataIntegrationAPI:
         Returns:
             Dictionary containing backup metadata
         """
-        try:
-            url = f"{self.base_url}/api/v1/backups/{backup_id}"
-            response = self.session.get(url)
-            response.raise_for_status()
-            
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get backup metadata for {backup_id}: {str(e)}")
-            raise VeeamAPIError(f"Failed to get backup metadata: {str(e)}")
+        url = self._u.backup.format(backup_id)
+        return self._conditional_get(url)
     
+    @_api_call("Failed to get iSCSI mount info")
     def get_iscsi_mount_info(self, session_id: str) -> Dict[str, Any]:
         """
         Get iSCSI mount information for accessing mounted backup data.
@@ -1323,91 +1925,109 @@ class VeeamDataIntegrationAPI:
         Returns:
             Dictionary containing iSCSI mount information and access details
         """
-        try:
-            # Get mount session details from Data Integration API
-            url = f"{self.base_url}/api/v1/dataIntegration/{session_id}"
-            
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev0',
-                'Authorization': f'Bearer {self.auth_token}'
-            }
-            
-            response = self.session.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            mount_info = response.json()
-            
-            # Extract iSCSI information
-            iscsi_info = {
-                'session_id': session_id,
-                'mount_state': mount_info.get('mountState', 'Unknown'),
-                'backup_id': mount_info.get('backupId'),
-                'backup_name': mount_info.get('backupName'),
-                'restore_point_id': mount_info.get('restorePointId'),
-                'restore_point_name': mount_info.get('restorePointName'),
-                'initiator_name': mount_info.get('initiatorName'),
-                'iscsi_targets': [],
-                'access_methods': []
-            }
+        # Get mount session details from Data Integration API
+        url = self._u.data_integration_session.format(session_id)
+        
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        
+        mount_info = self._json(response)
+        
+        # Extract iSCSI information
+        iscsi_info = {
+            'session_id': session_id,
+            'mount_state': mount_info.get('mountState', 'Unknown'),
+            'backup_id': mount_info.get('backupId'),
+            'backup_name': mount_info.get('backupName'),
+            'restore_point_id': mount_info.get('restorePointId'),
+            'restore_point_name': mount_info.get('restorePointName'),
+            'initiator_name': mount_info.get('initiatorName'),
+            'iscsi_targets': [],
+            'access_methods': []
+        }
+        
+        # Extract iSCSI target information
+        if 'info' in mount_info:
+            info = mount_info['info']
+            server_ips = info.get('serverIps', [])
+            server_port = info.get('serverPort', 3260)
+            mode = info.get('mode', 'ISCSI')
+            
+            for disk in info.get('disks', []):
+                target_info = {
+                    'disk_id': disk.get('diskId'),
+                    'disk_name': disk.get('diskName'),
+                    'iqn': disk.get('accessLink'),
+                    'server_ips': server_ips,
+                    'server_port': server_port,
+                    'mode': mode
+                }
+                iscsi_info['iscsi_targets'].append(target_info)
             
-            # Extract iSCSI target information
-            if 'info' in mount_info:
-                info = mount_info['info']
-                server_ips = info.get('serverIps', [])
-                server_port = info.get('serverPort', 3260)
-                mode = info.get('mode', 'ISCSI')
+            # Create access methods for different scenarios
+            for i, target in enumerate(iscsi_info['iscsi_targets']):
+                server_ip = server_ips[0] if server_ips else '{self.mount_server_name}'
+                
+                # Method 1: Direct iSCSI access (requires iSCSI initiator)
+                iscsi_info['access_methods'].append({
+                    'method': 'iscsi_direct',
+                    'description': 'Direct iSCSI connection to target',
+                    'server_ip': server_ip,
+                    'port': server_port,
+                    'iqn': target['iqn'],
+                    'command': f"iscsiadm -m discovery -t st -p {server_ip}:{server_port}",
+                    'mount_command': f"iscsiadm -m node -T {target['iqn']} -p {server_ip}:{server_port} -l"
+                })
                 
-                for disk in info.get('disks', []):
-                    target_info = {
-                        'disk_id': disk.get('diskId'),
-                        'disk_name': disk.get('diskName'),
-                        'iqn': disk.get('accessLink'),
-                        'server_ips': server_ips,
-                        'server_port': server_port,
-                        'mode': mode
-                    }
-                    iscsi_info['iscsi_targets'].append(target_info)
+                # Method 2: UNC path simulation (for Windows environments)
+                iscsi_info['access_methods'].append({
+                    'method': 'unc_simulation',
+                    'description': 'Simulated UNC path for Windows file access',
+                    'unc_path': f"\\\\{server_ip}\\iscsi\\{target['iqn'].replace(':', '_')}",
+                    'note': 'This is a simulated path - actual access requires iSCSI initiator'
+                })
                 
-                # Create access methods for different scenarios
-                for i, target in enumerate(iscsi_info['iscsi_targets']):
-                    server_ip = server_ips[0] if server_ips else '{self.mount_server_name}'
-                    
-                    # Method 1: Direct iSCSI access (requires iSCSI initiator)
-                    iscsi_info['access_methods'].append({
-                        'method': 'iscsi_direct',
-                        'description': 'Direct iSCSI connection to target',
-                        'server_ip': server_ip,
-                        'port': server_port,
-                        'iqn': target['iqn'],
-                        'command': f"iscsiadm -m discovery -t st -p {server_ip}:{server_port}",
-                        'mount_command': f"iscsiadm -m node -T {target['iqn']} -p {server_ip}:{server_port} -l"
-                    })
-                    
-                    # Method 2: UNC path simulation (for Windows environments)
-                    iscsi_info['access_methods'].append({
-                        'method': 'unc_simulation',
-                        'description': 'Simulated UNC path for Windows file access',
-                        'unc_path': f"\\\\{server_ip}\\iscsi\\{target['iqn'].replace(':', '_')}",
-                        'note': 'This is a simulated path - actual access requires iSCSI initiator'
-                    })
-                    
-                    # Method 3: Veeam server local path (if accessible)
-                    iscsi_info['access_methods'].append({
-                        'method': 'veeam_server_path',
-                        'description': 'Path on Veeam server where iSCSI target is mounted',
-                        'server_path': f"C:\\VeeamFLR\\{session_id}\\{target['disk_name']}",
-                        'server_ip': server_ip,
-                        'note': 'Requires access to Veeam server file system'
-                    })
-            
-            logger.info(f"Retrieved iSCSI mount info for session {session_id}")
-            return iscsi_info
+                # Method 3: Veeam server local path (if accessible)
+                iscsi_info['access_methods'].append({
+                    'method': 'veeam_server_path',
+                    'description': 'Path on Veeam server where iSCSI target is mounted',
+                    'server_path': f"C:\\VeeamFLR\\{session_id}\\{target['disk_name']}",
+                    'server_ip': server_ip,
+                    'note': 'Requires access to Veeam server file system'
+                })
+        
+        logger.info("Retrieved iSCSI mount info for session %s", session_id)
+        return iscsi_info
+    
+    def get_iscsi_mount_info_batch(self, session_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get iSCSI mount information for several sessions at once.
+        
+        The Data Integration API has no multi-session lookup, so the per-session
+        requests are pipelined over the connection pool instead of issued serially.
+        
+        Args:
+            session_ids: iSCSI session IDs from Data Integration API
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get iSCSI mount info for {session_id}: {str(e)}")
-            raise VeeamAPIError(f"Failed to get iSCSI mount info: {str(e)}")
+        Returns:
+            Dictionary mapping each session ID to its iSCSI mount information;
+            sessions whose lookup failed are logged and omitted
+        """
+        if not session_ids:
+            return {}
+        
+        def fetch(session_id: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.get_iscsi_mount_info(session_id)
+            except VeeamAPIError as e:
+                logger.warning("Failed to get iSCSI mount info for session %s: %s", session_id, e)
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(ISCSI_INFO_MAX_WORKERS, len(session_ids))) as executor:
+            results = executor.map(fetch, session_ids)
+            return {session_id: info for session_id, info in zip(session_ids, results) if info is not None}
     
+    @_api_call("Failed to create iSCSI Manual Mode session")
     def create_flr_session_for_restore_point(self, restore_point_id: str, credentials_id: str = None) -> Dict[str, Any]:
         """
         Create a File Level Restore session using iSCSI Manual Mode.
@@ -1420,74 +2040,62 @@ class VeeamDataIntegrationAPI:
         Returns:
             Dictionary containing session information with actual folder name
         """
-        try:
-            # Use configured mount server instead of extracting from base_url
-            # Use iSCSI Manual Mode instead of FLR API
-            # This exposes the actual folder name in session logs
-            iscsi_data = {
-                'restorePointId': restore_point_id,
-                'type': 'ISCSIWindowsMount',
-                'allowedIps': [self.mount_server_name],  # Use configured mount server
-                'targetServerName': self.mount_server_name,  # Use configured mount server
-                'targetServerCredentialsId': credentials_id or '00000000-0000-0000-0000-000000000000'
-            }
-            
-            # Add mountHostId if configured
-            if self.mount_host_id:
-                iscsi_data['mountHostId'] = self.mount_host_id
-            
-            url = f"{self.base_url}/api/v1/dataIntegration/publish"
-            headers = {
-                'accept': 'application/json',
-                'x-api-version': '1.2-rev1',
-                'Authorization': f'Bearer {self.auth_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            logger.info(f"Creating iSCSI Manual Mode session for restore point {restore_point_id}")
-            response = self.session.post(url, json=iscsi_data, headers=headers, timeout=60)
+        # Use configured mount server instead of extracting from base_url
+        # Use iSCSI Manual Mode instead of FLR API
+        # This exposes the actual folder name in session logs
+        iscsi_data = {
+            'restorePointId': restore_point_id,
+            'type': 'ISCSIWindowsMount',
+            'allowedIps': [self.mount_server_name],  # Use configured mount server
+            'targetServerName': self.mount_server_name,  # Use configured mount server
+            'targetServerCredentialsId': credentials_id or '00000000-0000-0000-0000-000000000000'
+        }
+        
+        # Add mountHostId if configured
+        if self.mount_host_id:
+            iscsi_data['mountHostId'] = self.mount_host_id
+        
+        url = self._u.data_integration_publish
+        headers = {'x-api-version': '1.2-rev1'}
+        
+        logger.info("Creating iSCSI Manual Mode session for restore point %s", restore_point_id)
+        response = self._post_json(url, iscsi_data, headers=headers, timeout=60)
+        
+        if response.status_code in [200, 201]:  # Accept both 200 and 201
+            session_info = self._json(response)
+            session_id = session_info.get('id')
             
-            if response.status_code in [200, 201]:  # Accept both 200 and 201
-                session_info = response.json()
-                session_id = session_info.get('id')
-                
-                if session_id:
-                    # Get the actual folder name from Data Integration API
-                    folder_name = self._get_folder_name_from_data_integration(session_id)
-                    
-                    if folder_name:
-                        # Store session info with correct UNC path
-                        self.mount_sessions[session_id] = {
-                            'backup_id': restore_point_id,
-                            'mount_point': f"\\\\{self.mount_server_name}\\VeeamFLR\\{folder_name}",
-                            'folder_name': folder_name,
-                            'mounted_at': datetime.utcnow(),
-                            'session_info': session_info,
-                            'mount_type': 'ISCSI'  # Use ISCSI for iSCSI Manual Mode sessions
-                        }
-                        logger.info(f"Successfully created iSCSI Manual Mode session {session_id} with folder {folder_name}")
-                    else:
-                        # Fallback: use session ID as folder name
-                        fallback_folder_name = f"target_{session_id[:8]}"
-                        self.mount_sessions[session_id] = {
-                            'backup_id': restore_point_id,
-                            'mount_point': f"\\{self.mount_server_name}\\VeeamFLR\\{fallback_folder_name}",
-                            'folder_name': fallback_folder_name,
-                            'mounted_at': datetime.utcnow(),
-                            'session_info': session_info,
-                            'mount_type': 'ISCSI'  # Use ISCSI for iSCSI Manual Mode sessions
-                        }
-                        logger.warning(f"Could not determine folder name for session {session_id}, using fallback: {fallback_folder_name}")
-                
-                return session_info
-            else:
-                error_msg = f"iSCSI Manual Mode creation failed with status {response.status_code}: {response.text}"
-                logger.error(error_msg)
-                raise VeeamAPIError(error_msg)
+            if session_id:
+                # Get the actual folder name from Data Integration API
+                folder_name = self._get_folder_name_from_data_integration(session_id)
                 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to create iSCSI Manual Mode session: {str(e)}")
-            raise VeeamAPIError(f"Failed to create iSCSI Manual Mode session: {str(e)}")
+                if folder_name:
+                    # Store session info with correct UNC path
+                    self.mount_sessions[session_id] = MountSession(
+                        backup_id=restore_point_id,
+                        mount_point=f"\\\\{self.mount_server_name}\\VeeamFLR\\{folder_name}",
+                        folder_name=folder_name,
+                        mounted_at=time.time_ns(),
+                        mount_type='ISCSI'  # Use ISCSI for iSCSI Manual Mode sessions
+                    )
+                    logger.info("Successfully created iSCSI Manual Mode session %s with folder %s", session_id, folder_name)
+                else:
+                    # Fallback: use session ID as folder name
+                    fallback_folder_name = f"target_{session_id[:8]}"
+                    self.mount_sessions[session_id] = MountSession(
+                        backup_id=restore_point_id,
+                        mount_point=f"\\{self.mount_server_name}\\VeeamFLR\\{fallback_folder_name}",
+                        folder_name=fallback_folder_name,
+                        mounted_at=time.time_ns(),
+                        mount_type='ISCSI'  # Use ISCSI for iSCSI Manual Mode sessions
+                    )
+                    logger.warning("Could not determine folder name for session %s, using fallback: %s", session_id, fallback_folder_name)
+            
+            return session_info
+        else:
+            error_msg = f"iSCSI Manual Mode creation failed with status {response.status_code}: {response.text}"
+            logger.error(error_msg)
+            raise VeeamAPIError(error_msg)
     
     def _get_folder_name_from_session_logs(self, session_id: str, max_wait_time: int = 120) -> str:
         """
@@ -1506,22 +2114,18 @@ class VeeamDataIntegrationAPI:
         while time.time() - start_time < max_wait_time:
             try:
                 # Get session logs
-                logs_url = f"{self.base_url}/api/v1/sessions/{session_id}/logs"
-                headers = {
-                    'accept': 'application/json',
-                    'x-api-version': '1.2-rev1',
-                    'Authorization': f'Bearer {self.auth_token}'
-                }
+                logs_url = self._u.session_logs.format(session_id)
+                headers = {'x-api-version': '1.2-rev1'}
                 
                 response = self.session.get(logs_url, headers=headers, timeout=30)
                 if response.status_code == 200:
-                    logs_data = response.json()
+                    logs_data = self._json(response)
                     records = logs_data.get('records', [])
                     
                     # Look for the folder name in log records
                     for record in records:
                         title = record.get('title', '')
-                        logger.debug(f"Checking log record: {title}")
+                        logger.debug("Checking log record: %s", title)
                         if 'VeeamFLR' in title and 'mounted to' in title:
                             # Extract folder name from title like "Disks are mounted to {self.mount_server_name} in C:\\VeeamFLR\\target_e0b41da3"
                             import re
@@ -1535,15 +2139,15 @@ class VeeamDataIntegrationAPI:
                                 match = re.search(pattern, title)
                                 if match:
                                     folder_name = match.group(1)
-                                    logger.info(f"Found folder name {folder_name} in session logs using pattern: {pattern}")
+                                    logger.info("Found folder name %s in session logs using pattern: %s", folder_name, pattern)
                                     return folder_name
-                            logger.warning(f"Could not extract folder name from log title: {title}")
+                            logger.warning("Could not extract folder name from log title: %s", title)
                 
                 # Check if session is still working
-                session_url = f"{self.base_url}/api/v1/sessions/{session_id}"
+                session_url = self._u.session.format(session_id)
                 session_response = self.session.get(session_url, headers=headers, timeout=30)
                 if session_response.status_code == 200:
-                    session_data = session_response.json()
+                    session_data = self._json(session_response)
                     state = session_data.get('state')
                     if state == 'Working':
                         time.sleep(5)  # Wait 5 seconds before checking again
@@ -1552,7 +2156,7 @@ class VeeamDataIntegrationAPI:
                         break
                 
             except Exception as e:
-                logger.warning(f"Error getting session logs: {str(e)}")
+                logger.warning("Error getting session logs: %s", e)
                 time.sleep(5)
         
     def _get_folder_name_from_data_integration(self, session_id: str, max_wait_time: int = 120) -> str:
@@ -1573,16 +2177,11 @@ class VeeamDataIntegrationAPI:
         while time.time() - start_time < max_wait_time:
             try:
                 # Get Data Integration session details
-                url = f"{self.base_url}/api/v1/dataIntegration/{session_id}"
-                headers = {
-                    'accept': 'application/json',
-                    'x-api-version': '1.2-rev0',
-                    'Authorization': f'Bearer {self.auth_token}'
-                }
+                url = self._u.data_integration_session.format(session_id)
                 
-                response = self.session.get(url, headers=headers, timeout=30)
+                response = self.session.get(url, timeout=30)
                 if response.status_code == 200:
-                    session_data = response.json()
+                    session_data = self._json(response)
                     
                     # Extract folder name from mount points
                     info = session_data.get('info', {})
@@ -1595,31 +2194,31 @@ class VeeamDataIntegrationAPI:
                             match = re.search(r'VeeamFLR\\([^\\]+)', mount_point)
                             if match:
                                 folder_name = match.group(1)
-                                logger.info(f"Found folder name {folder_name} in Data Integration API mount points")
+                                logger.info("Found folder name %s in Data Integration API mount points", folder_name)
                                 return folder_name
                     
                     # If no mount points found yet, check if session is still working
                     mount_state = session_data.get('mountState')
                     if mount_state == 'Mounted':
-                        logger.info(f"Session {session_id} is mounted but no mount points found yet")
+                        logger.info("Session %s is mounted but no mount points found yet", session_id)
                         time.sleep(2)  # Wait 2 seconds before checking again
                         continue
                     elif mount_state in ['Failed', 'Unmounted']:
-                        logger.warning(f"Session {session_id} mount state is {mount_state}")
+                        logger.warning("Session %s mount state is %s", session_id, mount_state)
                         break
                     else:
-                        logger.info(f"Session {session_id} mount state is {mount_state}, waiting...")
+                        logger.info("Session %s mount state is %s, waiting...", session_id, mount_state)
                         time.sleep(5)  # Wait 5 seconds before checking again
                         continue
                 else:
-                    logger.warning(f"Data Integration API returned status {response.status_code} for session {session_id}")
+                    logger.warning("Data Integration API returned status %s for session %s", response.status_code, session_id)
                     time.sleep(5)
                     
             except Exception as e:
-                logger.warning(f"Error getting Data Integration session details: {str(e)}")
+                logger.warning("Error getting Data Integration session details: %s", e)
                 time.sleep(5)
         
-        logger.warning(f"Could not find folder name in Data Integration API for {session_id}")
+        logger.warning("Could not find folder name in Data Integration API for %s", session_id)
         return None
 
     def _build_unc_path(self, session_id: str, folder_name: str) -> str:
@@ -1648,6 +2247,342 @@ class VeeamDataIntegrationAPI:
         return f"\\\\{self.mount_server_name}\\{drive_letter}$\\VeeamFLR\\{folder_name}"
 
 
+    # ------------------------------------------------------------------
+    # Async transport (httpx over HTTP/2, else aiohttp). Mirrors the read/unmount
+    # calls so that independent requests can be issued concurrently with asyncio.gather.
+    # ------------------------------------------------------------------
+    
+    def _auth_headers(self, api_version: str = '1.2-rev0') -> Dict[str, str]:
+        """Build the standard Veeam request headers for the current token."""
+        return {
+            'accept': 'application/json',
+            'x-api-version': api_version,
+            'Authorization': f'Bearer {self.auth_token}'
+        }
+    
+    async def _aio_session(self):
+        """
+        Return the async client, creating it on first use.
+        
+        httpx with HTTP/2 is preferred so concurrent calls share one multiplexed
+        TCP+TLS connection; aiohttp (HTTP/1.1 keep-alive pool) is the fallback.
+        """
+        if not HAS_ASYNC_HTTP:
+            raise VeeamAPIError("Neither httpx[http2] nor aiohttp is installed - async API calls are unavailable")
+        loop = asyncio.get_running_loop()
+        if self._aio is None or self._aio_closed() or self._aio_loop is not loop:
+            # One client per event loop, reused by every call so the pool stays warm
+            if HAS_HTTPX_HTTP2:
+                self._aio = httpx.AsyncClient(
+                    http2=True,
+                    verify=self.verify_ssl,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16,
+                                        keepalive_expiry=75),
+                    timeout=httpx.Timeout(60)
+                )
+            else:
+                if isinstance(self.verify_ssl, str):
+                    # A CA bundle path, as requests and httpx accept for verify
+                    ssl_context = ssl.create_default_context(cafile=self.verify_ssl)
+                else:
+                    ssl_context = None if self.verify_ssl else False
+                connector = aiohttp.TCPConnector(
+                    ssl=ssl_context,
+                    limit=64,
+                    limit_per_host=32,
+                    keepalive_timeout=75
+                )
+                self._aio = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=60))
+            self._aio_loop = loop
+        return self._aio
+    
+    def _aio_closed(self) -> bool:
+        """Whether the current async client has been closed."""
+        if HAS_HTTPX_HTTP2:
+            return self._aio.is_closed
+        return self._aio.closed
+    
+    async def _a_request_json(self, method: str, url: str, error_message: str, **kwargs) -> Any:
+        """
+        Issue a request on the async client and decode the JSON body.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            error_message: Prefix for the raised VeeamAPIError
+            **kwargs: Extra arguments passed to the client (headers, params, data)
+            
+        Returns:
+            Decoded JSON response, or None for an empty body
+        """
+        client = await self._aio_session()
+        try:
+            if HAS_HTTPX_HTTP2:
+                response = await client.request(method, url, **kwargs)
+                response.raise_for_status()
+                body = response.content
+            else:
+                async with client.request(method, url, **kwargs) as response:
+                    response.raise_for_status()
+                    body = await response.read()
+            return _loads(body) if body else None
+        except self._async_errors() as e:
+            logger.error("%s: %s", error_message, e)
+            raise VeeamAPIError(f"{error_message}: {str(e)}") from e
+    
+    @staticmethod
+    def _async_errors() -> tuple:
+        """Transport exceptions of the active async client."""
+        if HAS_HTTPX_HTTP2:
+            return (httpx.HTTPError,)
+        return (aiohttp.ClientError, asyncio.TimeoutError)
+    
+    async def _a_authenticate(self) -> bool:
+        """Async counterpart of authenticate()."""
+        auth_url = self._u.auth
+        auth_data = {
+            'grant_type': 'password',
+            'username': self.username,
+            'password': self.password,
+            'refresh_token': '',
+            'code': '',
+            'use_short_term_refresh': '',
+            'vbr_token': ''
+        }
+        headers = {
+            'accept': 'application/json',
+            'x-api-version': '1.2-rev0',
+            'Content-Type': 'application/x-www-form-urlencoded'
+        }
+        auth_result = await self._a_request_json('POST', auth_url, "Authentication failed",
+                                                 data=auth_data, headers=headers)
+        auth_result = auth_result or {}
+        self.auth_token = auth_result.get('access_token')
+        if not self.auth_token:
+            raise VeeamAPIError("Authentication failed: No access token received")
+        self._token_expiry = time.time() + int(auth_result.get('expires_in', 3600))
+        # Keep the sync session usable with the refreshed token
+        self.session.headers.update({
+            'Authorization': f'Bearer {self.auth_token}',
+            'Content-Type': 'application/json'
+        })
+        return True
+    
+    async def _a_get_backups(self) -> List[Dict[str, Any]]:
+        """Async counterpart of get_backups()."""
+        url = self._u.backups
+        body = await self._a_request_json('GET', url, "Failed to retrieve backups",
+                                          headers=self._auth_headers())
+        return self._unwrap(body, 'data', 'backups')
+    
+    async def _a_get_restore_points(self, backup_id: str) -> List[Dict[str, Any]]:
+        """Async counterpart of get_restore_points()."""
+        url = self._u.restore_points
+        body = await self._a_request_json('GET', url, "Failed to retrieve restore points",
+                                          params={'backupId': backup_id}, headers=self._auth_headers())
+        return self._unwrap(body, 'data', 'restorePoints')
+    
+    async def _a_prefetch_restore_points(self, backup_ids: List[str]) -> None:
+        """Fetch restore points for several backups concurrently into the TTL cache."""
+        try:
+            results = await asyncio.gather(*[self._a_get_restore_points(bid) for bid in backup_ids])
+            for backup_id, restore_points in zip(backup_ids, results):
+                self._store_restore_points(backup_id, restore_points)
+        finally:
+            await self.aclose()
+    
+    async def _a_get_mount_sessions(self) -> List[Dict[str, Any]]:
+        """Async counterpart of get_mount_sessions()."""
+        url = self._u.data_integration
+        body = await self._a_request_json('GET', url, "Failed to retrieve mount sessions",
+                                          headers=self._auth_headers())
+        return self._unwrap(body)
+    
+    async def _a_get_mount_status(self, session_id: str) -> Dict[str, Any]:
+        """Async counterpart of get_mount_status()."""
+        url = self._u.mount_session.format(session_id)
+        return await self._a_request_json('GET', url, "Failed to get mount status",
+                                          headers=self._auth_headers())
+    
+    async def _a_list_files(self, session_id: str, path: str = "/") -> List[Dict[str, Any]]:
+        """Async counterpart of list_files()."""
+        url = self._u.mount_session_files.format(session_id)
+        return await self._a_request_json('GET', url, "Failed to list files",
+                                          params={'path': path}, headers=self._auth_headers())
+    
+    async def list_tree(self, session_id: str, path: str = '/', depth: int = 3) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Walk a mounted backup's directory tree, listing sibling directories concurrently.
+        
+        Listings are memoized per (session_id, path) until the session is unmounted,
+        so repeated walks of the same subtree do not hit the API again.
+        
+        Args:
+            session_id: ID of the mount session
+            path: Directory to start from
+            depth: Number of directory levels to list
+            
+        Returns:
+            Dictionary mapping each listed directory path to its entries
+        """
+        tree: Dict[str, List[Dict[str, Any]]] = {}
+        semaphore = asyncio.Semaphore(LIST_TREE_CONCURRENCY)
+        await self._a_walk_tree(session_id, path, depth, semaphore, tree)
+        return tree
+    
+    async def _a_walk_tree(self, session_id: str, path: str, depth: int,
+                           semaphore: asyncio.Semaphore, tree: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Recursive worker for list_tree()."""
+        if depth <= 0:
+            return
+        key = (session_id, path)
+        entries = self._fs_cache.get(key)
+        if entries is None:
+            async with semaphore:
+                entries = self._unwrap(await self._a_list_files(session_id, path))
+            self._fs_cache[key] = entries
+        tree[path] = entries
+        
+        subdirs = [entry['path'] for entry in entries if entry.get('isDirectory') and entry.get('path')]
+        if subdirs:
+            await asyncio.gather(*[self._a_walk_tree(session_id, subdir, depth - 1, semaphore, tree)
+                                   for subdir in subdirs])
+    
+    def _invalidate_fs_cache(self, session_id: str) -> None:
+        """Forget memoized directory listings for a session."""
+        for key in [k for k in list(self._fs_cache) if k[0] == session_id]:
+            self._fs_cache.pop(key, None)
+    
+    async def _a_get_backup_metadata(self, backup_id: str) -> Dict[str, Any]:
+        """Async counterpart of get_backup_metadata()."""
+        url = self._u.backup.format(backup_id)
+        return await self._a_request_json('GET', url, "Failed to get backup metadata",
+                                          headers=self._auth_headers())
+    
+    async def _a_unmount_backup(self, session_id: str) -> bool:
+        """Async counterpart of unmount_backup()."""
+        tracked = self.mount_sessions.get(session_id)
+        flr_url = self._u.flr_unmount.format(session_id)
+        di_url = self._u.data_integration_unpublish.format(session_id)
+        attempts = [(flr_url, '1.2-rev1'), (di_url, '1.2-rev0')]
+        if tracked is not None and tracked.mount_type != 'FLR':
+            attempts = attempts[1:]
+        elif tracked is not None:
+            attempts = attempts[:1]
+        
+        for url, api_version in attempts:
+            try:
+                await self._a_request_json('POST', url, "Unmount failed",
+                                           headers=self._auth_headers(api_version))
+            except VeeamAPIError as e:
+                logger.debug("Unmount attempt failed for %s: %s", session_id, e)
+                continue
+            self._invalidate_fs_cache(session_id)
+            if tracked is not None:
+                self.mount_sessions.pop(session_id, None)
+                self._invalidate_backup_cache(tracked.backup_id)
+                self._clear_mount_ready(tracked.backup_id)
+                logger.info("Successfully unmounted %s session %s", tracked.mount_type, session_id)
+            return True
+        return False
+    
+    async def _a_cleanup_all_mounts(self) -> None:
+        """Unmount every tracked session concurrently, then close the async client."""
+        session_ids = list(self.mount_sessions.keys())
+        try:
+            results = await asyncio.gather(*[self._a_unmount_backup(sid) for sid in session_ids],
+                                           return_exceptions=True)
+            for session_id, result in zip(session_ids, results):
+                if isinstance(result, Exception):
+                    logger.error("Failed to cleanup mount session %s: %s", session_id, result)
+        finally:
+            await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the async client if one was opened on the running event loop."""
+        if (self._aio is not None and not self._aio_closed()
+                and self._aio_loop is asyncio.get_running_loop()):
+            if HAS_HTTPX_HTTP2:
+                await self._aio.aclose()
+            else:
+                await self._aio.close()
+        self._aio = None
+        self._aio_loop = None
+
+
+class AsyncVeeamDataIntegrationAPI:
+    """
+    asyncio facade over VeeamDataIntegrationAPI.
+    
+    Reads and unmounts run on the async transport (httpx over HTTP/2, else aiohttp);
+    mounts, which poll session logs synchronously, run in worker threads. Independent
+    calls can therefore be awaited together with asyncio.gather.
+    """
+    
+    def __init__(self, base_url: str, username: str, password: str, verify_ssl: Union[bool, str] = False,
+                 **kwargs):
+        """
+        Initialize the async client.
+        
+        Args:
+            base_url: Base URL of the Veeam Backup & Replication server
+            username: Username for authentication
+            password: Password for authentication
+            verify_ssl: Whether to verify SSL certificates, or a path to a CA bundle
+            **kwargs: Mount server options passed to VeeamDataIntegrationAPI
+        """
+        self.api = VeeamDataIntegrationAPI(base_url, username, password, verify_ssl, **kwargs)
+    
+    @property
+    def mount_sessions(self) -> MountSessionRegistry:
+        """Locally tracked mount sessions of the underlying client."""
+        return self.api.mount_sessions
+    
+    async def __aenter__(self) -> 'AsyncVeeamDataIntegrationAPI':
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def authenticate(self) -> bool:
+        """Authenticate with the Veeam API and obtain an access token."""
+        return await self.api._a_authenticate()
+    
+    async def get_backups(self) -> List[Dict[str, Any]]:
+        """Retrieve list of available backups."""
+        return await self.api._a_get_backups()
+    
+    async def list_files(self, session_id: str, path: str = "/") -> List[Dict[str, Any]]:
+        """List files and directories in a mounted backup."""
+        return await self.api._a_list_files(session_id, path)
+    
+    async def mount_backup(self, backup_id: str) -> Dict[str, Any]:
+        """Mount a backup; runs the synchronous mount flow in a worker thread."""
+        return await asyncio.to_thread(self.api.mount_backup, backup_id)
+    
+    async def wait_for_mount(self, backup_id: str, timeout: Optional[float] = None) -> Optional[str]:
+        """Wait for a mount of the backup to become ready; returns its session ID or None."""
+        return await asyncio.to_thread(self.api.wait_for_mount, backup_id, timeout)
+    
+    async def unmount_backup(self, session_id: str) -> bool:
+        """Unmount a previously mounted backup."""
+        return await self.api._a_unmount_backup(session_id)
+    
+    async def cleanup_all_mounts(self) -> None:
+        """Unmount every tracked session concurrently."""
+        session_ids = list(self.api.mount_sessions.keys())
+        results = await asyncio.gather(*(self.unmount_backup(sid) for sid in session_ids),
+                                       return_exceptions=True)
+        for session_id, result in zip(session_ids, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to cleanup mount session %s: %s", session_id, result)
+    
+    async def aclose(self) -> None:
+        """Close the async transport."""
+        await self.api.aclose()
+
+
 class LocalFileSystemMounter:
     """
     Alternative implementation for local file system mounting when direct API access is not available.
@@ -1678,6 +2613,7 @@ class LocalFileSystemMounter:
         Returns:
             Mount point path
         """
+        mounted_at = time.time_ns()
         if mount_point is None:
             # Generate a unique mount point
             import uuid
@@ -1686,15 +2622,16 @@ class LocalFileSystemMounter:
         # Create mount point directory
         os.makedirs(mount_point, exist_ok=True)
             
-        # Store mount session info
-        session_id = str(uuid.uuid4())
+        # Store mount session info; monotonic ns + pid stays unique across sub-second
+        # mounts and across worker processes sharing base_path
+        session_id = f"local_{time.monotonic_ns():016x}_{os.getpid():x}"
         self.mount_sessions[session_id] = {
             'backup_file': backup_file_path,
             'mount_point': mount_point,
-            'mounted_at': datetime.utcnow()
+            'mounted_at': mounted_at
         }
             
-        logger.info(f"Mounted backup file {backup_file_path} to {mount_point}")
+        logger.info("Mounted backup file %s to %s", backup_file_path, mount_point)
         return mount_point
     
     def unmount_backup_file(self, session_id: str) -> bool:
@@ -1717,12 +2654,12 @@ class LocalFileSystemMounter:
                     import shutil
                     shutil.rmtree(mount_point)
                 
-                logger.info(f"Unmounted backup from {mount_point}")
+                logger.info("Unmounted backup from %s", mount_point)
                 return True
             else:
-                logger.warning(f"Mount session {session_id} not found")
+                logger.warning("Mount session %s not found", session_id)
                 return False
                 
         except Exception as e:
-            logger.error(f"Failed to unmount session {session_id}: {str(e)}")
+            logger.error("Failed to unmount session %s: %s", session_id, e)
             return False
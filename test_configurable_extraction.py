@@ -24,6 +24,15 @@ import time
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+FILE_TYPES = {
+    'Documents': ['.pdf', '.doc', '.docx', '.txt', '.rtf'],
+    'Spreadsheets': ['.xls', '.xlsx', '.csv'],
+    'Presentations': ['.ppt', '.pptx'],
+    'Databases': ['.mdf', '.ldf', '.ndf', '.dbf', '.ora', '.sqlite', '.db', '.sqlite3', '.sql', '.dump'],
+    'Logs': ['.log', '.txt'],
+    'Config': ['.ini', '.cfg', '.conf', '.config', '.xml', '.json', '.yaml', '.yml']
+}
+
 def test_configurable_extraction_system():
     """Test the configurable extraction system."""
     
@@ -248,16 +257,7 @@ def test_configurable_extraction_system():
                 print(f"  • {filter_type.value}: {filter_type.value.replace('_', ' ').title()}")
             
             print("\nSupported File Types:")
-            file_types = {
-                'Documents': ['.pdf', '.doc', '.docx', '.txt', '.rtf'],
-                'Spreadsheets': ['.xls', '.xlsx', '.csv'],
-                'Presentations': ['.ppt', '.pptx'],
-                'Databases': ['.mdf', '.ldf', '.ndf', '.dbf', '.ora', '.sqlite', '.db', '.sqlite3', '.sql', '.dump'],
-                'Logs': ['.log', '.txt'],
-                'Config': ['.ini', '.cfg', '.conf', '.config', '.xml', '.json', '.yaml', '.yml']
-            }
-            
-            for category, extensions in file_types.items():
+            for category, extensions in FILE_TYPES.items():
                 print(f"  • {category}: {', '.join(extensions)}")
             
             print("\n✅ All tests completed successfully!")
@@ -41,19 +41,12 @@ def test_data_integration_mount():
         'allowedIps': ['127.0.0.1']
     }
     
-    headers = {
-        'accept': 'application/json',
-        'x-api-version': '1.2-rev0',
-        'Authorization': f'Bearer {veeam_api.auth_token}',
-        'Content-Type': 'application/json'
-    }
-    
     print(f"📤 Mount Request:")
     print(f"URL: {url}")
     print(f"Data: {json.dumps(mount_data, indent=2)}")
     
     try:
-        response = veeam_api.session.post(url, json=mount_data, headers=headers)
+        response = veeam_api._post_json(url, mount_data)
         
         print(f"\n📥 Response:")
         print(f"Status Code: {response.status_code}")
@@ -61,12 +54,12 @@ def test_data_integration_mount():
         
         if response.status_code in [200, 201]:
             print(f"\n🎉 SUCCESS! Data Integration API mount worked!")
-            result = response.json()
+            result = veeam_api._json(response)
             print(f"Result: {json.dumps(result, indent=2)}")
         else:
             print(f"\n❌ Mount failed with status {response.status_code}")
             try:
-                error_data = response.json()
+                error_data = veeam_api._json(response)
                 print(f"Error JSON: {json.dumps(error_data, indent=2)}")
             except:
                 print("Could not parse error response as JSON")
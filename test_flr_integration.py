@@ -9,12 +9,60 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.services.veeam_api import VeeamDataIntegrationAPI, VeeamAPIError
+from src.services.unc_file_scanner import scan_unc_path
 import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
+from operator import itemgetter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _fetch_restore_points(veeam_api, backup_objects, max_workers=16):
+    """
+    Fetch restore points for every backup object concurrently.
+    
+    Returns a list aligned with backup_objects, holding None where the request failed.
+    """
+    def fetch(backup_obj):
+        url = f"{veeam_api.base_url}/api/v1/backupObjects/{backup_obj['id']}/restorePoints"
+        response = veeam_api.session.get(url)
+        if response.status_code != 200:
+            logger.warning(f"⚠️ Failed to get restore points for {backup_obj.get('name', backup_obj['id'])}: {response.status_code}")
+            return None
+        return veeam_api._json(response).get('data', [])
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(backup_objects))) as pool:
+        return list(pool.map(fetch, backup_objects))
+
+def _wait_for_flr_ready(veeam_api, session_id, timeout=60):
+    """
+    Poll the session state until the FLR share is mounted, backing off between checks.
+    
+    The browse endpoint can stay 404 while the UNC share is already usable, so this
+    watches the session state from get_active_sessions() instead.
+    
+    Returns True once the session reports Mounted/Working, False on timeout.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        state = next((s.get('state') for s in veeam_api.get_active_sessions() if s.get('id') == session_id), None)
+        if state in ('Mounted', 'Working'):
+            return True
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        # 0.25s, 0.5s, 1s, 2s, then 5s between checks, jittered +/-20%
+        delay = min(5.0, 0.25 * 2 ** attempt) * random.uniform(0.8, 1.2)
+        attempt += 1
+        logger.info(f"⏳ FLR session {session_id} is {state or 'not listed'}, checking again in {delay:.1f}s")
+        time.sleep(min(delay, remaining))
+
 def test_flr_integration():
     """Test the new FLR API integration."""
     
@@ -45,37 +93,33 @@ def test_flr_integration():
         active_sessions = veeam_api.get_active_sessions()
         logger.info(f"📋 Found {len(active_sessions)} active sessions")
         
-        for session in active_sessions:
-            logger.info(f"  - Session {session['id']}: {session['mount_type']} - {session['state']}")
-            logger.info(f"    Mount point: {session['mount_point']}")
+        if active_sessions and logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join(
+                f"  - Session {session['id']}: {session['mount_type']} - {session['state']}\n"
+                f"    Mount point: {session['mount_point']}"
+                for session in active_sessions
+            ))
         
         # Test FLR session creation (if we have restore points)
         logger.info("🔍 Looking for restore points to test FLR...")
         
         # Get backup objects first
         backup_objects_url = f"{veeam_api.base_url}/api/v1/backupObjects"
-        headers = {
-            'accept': 'application/json',
-            'x-api-version': '1.2-rev0',
-            'Authorization': f'Bearer {veeam_api.auth_token}'
-        }
-        
-        response = veeam_api.session.get(backup_objects_url, headers=headers)
+        response = veeam_api.session.get(backup_objects_url)
         if response.status_code == 200:
-            backup_objects = response.json().get('data', [])
+            backup_objects = veeam_api._json(response).get('data', [])
             logger.info(f"📦 Found {len(backup_objects)} backup objects")
             
-            # Try to create FLR session for first backup object
+            # Try to create FLR session for the first backup object with restore points
             if backup_objects:
-                backup_obj = backup_objects[0]
+                restore_points_by_object = _fetch_restore_points(veeam_api, backup_objects)
+                backup_obj, restore_points = next(
+                    ((obj, points) for obj, points in zip(backup_objects, restore_points_by_object) if points),
+                    (backup_objects[0], restore_points_by_object[0])
+                )
                 logger.info(f"🎯 Testing FLR with backup object: {backup_obj.get('name', 'Unknown')}")
                 
-                # Get restore points for this backup object
-                restore_points_url = f"{veeam_api.base_url}/api/v1/backupObjects/{backup_obj['id']}/restorePoints"
-                response = veeam_api.session.get(restore_points_url, headers=headers)
-                
-                if response.status_code == 200:
-                    restore_points = response.json().get('data', [])
+                if restore_points is not None:
                     logger.info(f"📅 Found {len(restore_points)} restore points")
                     
                     if restore_points:
@@ -95,10 +139,13 @@ def test_flr_integration():
                                 
                                 # Test UNC path scanning
                                 logger.info("🔍 Testing UNC path scanning...")
-                                from src.services.unc_file_scanner import scan_unc_path
                                 
                                 unc_path = f"\\\\172.21.234.6\\VeeamFLR\\{session_id}"
                                 try:
+                                    # Back off until the session reports mounted instead of scanning blind
+                                    if not _wait_for_flr_ready(veeam_api, session_id, timeout=60):
+                                        raise VeeamAPIError(f"FLR session {session_id} not mounted after 60s")
+                                    
                                     scanned_files = scan_unc_path(
                                         unc_path,
                                         username='Administrator',
@@ -107,12 +154,16 @@ def test_flr_integration():
                                     )
                                     logger.info(f"📄 Found {len(scanned_files)} files in UNC path")
                                     
-                                    extractable_files = [f for f in scanned_files if f.get('extractable', False)]
+                                    # Filter in C: the scanner sets 'extractable' on every entry it returns
+                                    extractable_files = list(compress(scanned_files, map(itemgetter('extractable'), scanned_files)))
                                     logger.info(f"📊 {len(extractable_files)} files are extractable for ML")
                                     
-                                    # Show sample files
-                                    for i, file in enumerate(extractable_files[:5]):  # Show first 5
-                                        logger.info(f"  📄 {file['name']} ({file['file_type']}) - {file['size']} bytes")
+                                    # Show sample files (first 5) in a single log record
+                                    if extractable_files:
+                                        logger.info("\n".join(
+                                            f"  📄 {file['name']} ({file['file_type']}) - {file['size']} bytes"
+                                            for file in extractable_files[:5]
+                                        ))
                                     
                                 except Exception as e:
                                     logger.warning(f"⚠️ UNC scanning failed: {str(e)}")
@@ -136,7 +187,7 @@ def test_flr_integration():
                     else:
                         logger.info("ℹ️ No restore points found for testing")
                 else:
-                    logger.warning(f"⚠️ Failed to get restore points: {response.status_code}")
+                    logger.warning("⚠️ Failed to get restore points")
             else:
                 logger.info("ℹ️ No backup objects found for testing")
         else:
@@ -5,16 +5,85 @@ This script tests our Flask application with the actual Veeam Backup Server.
 """
 
 import requests
+import io
 import json
+import re
+import ssl
+import threading
 import time
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import islice
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
+
+# Fast JSON decoding for response bodies (falls back to requests' json())
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional incremental JSON parser for large backup listings
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 # Suppress SSL warnings for testing
 requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
+# Markers showing the page is the React app's index.html, matched on raw bytes
+_REACT_MARKER = re.compile(rb'react|index\.html', re.IGNORECASE)
+
+
+def _json(response):
+    """Decode a response body, raising requests' JSONDecodeError like response.json()."""
+    if not HAS_ORJSON:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
+
+class _NoVerifyAdapter(HTTPAdapter):
+    """HTTPAdapter that hands every connection one prebuilt unverified SSL context."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        ctx = ssl.create_default_context()
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+        kwargs['ssl_context'] = ctx
+        return super().init_poolmanager(*args, **kwargs)
+
+
+class _ThreadBufferedStdout:
+    """sys.stdout stand-in that buffers the prints of each worker thread separately."""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        return getattr(self._local, 'buffer', self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def run_buffered(self, func):
+        """Call func, returning (result, everything it printed)."""
+        self._local.buffer = io.StringIO()
+        try:
+            return func(), self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
+
+
 class VeeamMLIntegrationTest:
     """Integration test for Veeam ML application."""
     
@@ -23,6 +92,17 @@ class VeeamMLIntegrationTest:
         self.flask_app_url = flask_app_url.rstrip('/')
         self.session = requests.Session()
         self.session.verify = False  # For testing only
+        # Keep connections to the Flask app and Veeam server alive across checks,
+        # retrying transient gateway errors on idempotent requests. A 500 is not
+        # retried: the error-path checks expect it and should see it at once
+        adapter = _NoVerifyAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                              raise_on_status=False)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
     def test_flask_app_startup(self):
         """Test if our Flask application is running."""
@@ -35,7 +115,7 @@ class VeeamMLIntegrationTest:
             
             if response.status_code == 200:
                 print("✅ Flask application is running!")
-                health_data = response.json()
+                health_data = _json(response)
                 print(f"📊 Health status: {health_data.get('status', 'Unknown')}")
                 return True
             else:
@@ -64,7 +144,6 @@ class VeeamMLIntegrationTest:
             response = self.session.post(
                 config_url, 
                 json=config_data,
-                headers={'Content-Type': 'application/json'},
                 timeout=10
             )
             
@@ -73,7 +152,7 @@ class VeeamMLIntegrationTest:
             if response.status_code in [200, 400, 500]:  # Any response is good for testing
                 print("✅ Configuration endpoint is working!")
                 try:
-                    response_data = response.json()
+                    response_data = _json(response)
                     print(f"📄 Response: {response_data}")
                 except:
                     print(f"📄 Response text: {response.text[:200]}...")
@@ -93,33 +172,38 @@ class VeeamMLIntegrationTest:
         try:
             # Test backup listing endpoint
             backups_url = f"{self.flask_app_url}/api/veeam/backups"
-            response = self.session.get(backups_url, timeout=10)
-            
-            print(f"📊 Backup discovery response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                print("✅ Backup discovery endpoint is working!")
-                try:
-                    backup_data = response.json()
-                    backups = backup_data.get('backups', [])
-                    print(f"📋 Found {len(backups)} backups")
-                    
-                    # Show first few backups
-                    for backup in backups[:3]:
-                        backup_name = backup.get('name', 'Unknown')
-                        backup_size = backup.get('size', 0)
-                        print(f"   💾 {backup_name} ({backup_size} bytes)")
-                        
-                except Exception as e:
-                    print(f"📄 Response: {response.text[:200]}...")
+            with self.session.get(backups_url, stream=True, timeout=10) as response:
+                print(f"📊 Backup discovery response status: {response.status_code}")
                 
-                return True
-            elif response.status_code == 500:
-                print("⚠️ Server error - this is expected without proper authentication")
-                return True  # Still counts as working endpoint
-            else:
-                print(f"⚠️ Unexpected response status: {response.status_code}")
-                return False
+                if response.status_code == 200:
+                    print("✅ Backup discovery endpoint is working!")
+                    try:
+                        # Stream the array so only the sample backups are held as dicts
+                        if HAS_IJSON:
+                            response.raw.decode_content = True
+                            backups = ijson.items(response.raw, 'backups.item')
+                        else:
+                            backups = iter(_json(response).get('backups', []))
+                        sample = list(islice(backups, 3))
+                        backup_count = len(sample) + sum(1 for _ in backups)
+                        print(f"📋 Found {backup_count} backups")
+                        
+                        # Show first few backups
+                        for backup in sample:
+                            backup_name = backup.get('name', 'Unknown')
+                            backup_size = backup.get('size', 0)
+                            print(f"   💾 {backup_name} ({backup_size} bytes)")
+                            
+                    except Exception as e:
+                        print(f"📄 Response: {response.text[:200]}...")
+                    
+                    return True
+                elif response.status_code == 500:
+                    print("⚠️ Server error - this is expected without proper authentication")
+                    return True  # Still counts as working endpoint
+                else:
+                    print(f"⚠️ Unexpected response status: {response.status_code}")
+                    return False
                 
         except requests.exceptions.RequestException as e:
             print(f"❌ Backup discovery test failed: {str(e)}")
@@ -147,7 +231,6 @@ class VeeamMLIntegrationTest:
             response = self.session.post(
                 jobs_url,
                 json=job_data,
-                headers={'Content-Type': 'application/json'},
                 timeout=10
             )
             
@@ -156,7 +239,7 @@ class VeeamMLIntegrationTest:
             if response.status_code in [200, 201, 400, 500]:  # Any response is good for testing
                 print("✅ ML job creation endpoint is working!")
                 try:
-                    response_data = response.json()
+                    response_data = _json(response)
                     print(f"📄 Response: {response_data}")
                 except:
                     print(f"📄 Response text: {response.text[:200]}...")
@@ -176,22 +259,23 @@ class VeeamMLIntegrationTest:
         try:
             # Test main page
             main_url = f"{self.flask_app_url}/"
-            response = self.session.get(main_url, timeout=5)
-            
-            if response.status_code == 200:
-                print("✅ Frontend is accessible!")
-                
-                # Check if it's serving React app
-                content = response.text
-                if 'react' in content.lower() or 'index.html' in content:
-                    print("✅ React application is being served!")
-                    return True
+            # The React markers sit in the head of the page, so only fetch its first 4KB;
+            # the read is capped too in case the server ignores the Range header
+            with self.session.get(main_url, headers={'Range': 'bytes=0-4095'},
+                                  stream=True, timeout=5) as response:
+                if response.status_code in (200, 206):
+                    print("✅ Frontend is accessible!")
+                    
+                    # Check if it's serving React app
+                    if _REACT_MARKER.search(response.raw.read(4096, decode_content=True)):
+                        print("✅ React application is being served!")
+                        return True
+                    else:
+                        print("⚠️ Frontend content doesn't appear to be React app")
+                        return False
                 else:
-                    print("⚠️ Frontend content doesn't appear to be React app")
+                    print(f"⚠️ Frontend responded with status: {response.status_code}")
                     return False
-            else:
-                print(f"⚠️ Frontend responded with status: {response.status_code}")
-                return False
                 
         except requests.exceptions.RequestException as e:
             print(f"❌ Frontend test failed: {str(e)}")
@@ -205,20 +289,34 @@ class VeeamMLIntegrationTest:
         print(f"🔧 Flask App: {self.flask_app_url}")
         print(f"🕐 Test Time: {datetime.now().isoformat()}")
         
-        test_results = {
-            'flask_startup': False,
-            'veeam_config': False,
-            'backup_discovery': False,
-            'ml_job_creation': False,
-            'frontend_integration': False
+        # Startup and configuration run first, in order; the remaining probes need
+        # the configured API but not each other
+        setup_probes = {
+            'flask_startup': self.test_flask_app_startup,
+            'veeam_config': self.test_veeam_configuration
+        }
+        probes = {
+            'backup_discovery': self.test_backup_discovery,
+            'ml_job_creation': self.test_ml_job_creation,
+            'frontend_integration': self.test_frontend_integration
         }
         
-        # Run all tests
-        test_results['flask_startup'] = self.test_flask_app_startup()
-        test_results['veeam_config'] = self.test_veeam_configuration()
-        test_results['backup_discovery'] = self.test_backup_discovery()
-        test_results['ml_job_creation'] = self.test_ml_job_creation()
-        test_results['frontend_integration'] = self.test_frontend_integration()
+        test_results = {name: probe() for name, probe in setup_probes.items()}
+        
+        # The independent probes are I/O bound, so overlap their network waits;
+        # each probe's output is buffered and printed in order once all have finished
+        stdout = _ThreadBufferedStdout(sys.stdout)
+        sys.stdout = stdout
+        try:
+            with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+                futures = {executor.submit(stdout.run_buffered, probe): name for name, probe in probes.items()}
+                outcomes = {futures[future]: future.result() for future in as_completed(futures)}
+        finally:
+            sys.stdout = stdout.stream
+        
+        for name in probes:
+            test_results[name], output = outcomes[name]
+            sys.stdout.write(output)
         
         # Generate summary
         print("\n" + "="*60)
@@ -10,22 +10,41 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from src.services.veeam_api import VeeamDataIntegrationAPI, VeeamAPIError
 import json
+import time
 
-def test_iscsi_mount_access():
-    """Test accessing existing iSCSI mounts."""
-    print("=== Testing iSCSI Mount Access ===")
-    
-    # Initialize API
+# (base_url, username) -> (bearer token, time.time() it expires at)
+_TOKEN_CACHE = {}
+
+def _get_api(base_url, username, password):
+    """Build an authenticated API client, reusing a cached token when still valid."""
     veeam_api = VeeamDataIntegrationAPI(
-        base_url="https://172.21.234.6:9419",
-        username="administrator",
-        password="Veeam123",
+        base_url=base_url,
+        username=username,
+        password=password,
         verify_ssl=False
     )
     
+    key = (base_url, username)
+    token, expires_at = _TOKEN_CACHE.get(key, (None, 0.0))
+    if token and time.time() < expires_at - 30:
+        veeam_api.auth_token = token
+        veeam_api._token_expiry = expires_at
+        veeam_api.session.headers['Authorization'] = f'Bearer {token}'
+        return veeam_api
+    
+    if not veeam_api.authenticate():
+        return None
+    _TOKEN_CACHE[key] = (veeam_api.auth_token, veeam_api._token_expiry)
+    return veeam_api
+
+def test_iscsi_mount_access():
+    """Test accessing existing iSCSI mounts."""
+    print("=== Testing iSCSI Mount Access ===")
+    
     try:
-        # Authenticate
-        if not veeam_api.authenticate():
+        # Authenticate (reuses the token from an earlier test while it is valid)
+        veeam_api = _get_api("https://172.21.234.6:9419", "administrator", "Veeam123")
+        if veeam_api is None:
             print("❌ Authentication failed")
             return
         
@@ -35,44 +54,53 @@ def test_iscsi_mount_access():
         mounted_sessions = veeam_api.get_mount_sessions()
         print(f"📊 Found {len(mounted_sessions)} mounted sessions")
         
-        # Test with first mounted session
-        if mounted_sessions:
-            first_session = mounted_sessions[0]
-            session_id = first_session['id']
-            print(f"\n🔍 Testing session: {session_id}")
-            print(f"   Backup: {first_session.get('backupName', 'Unknown')}")
-            print(f"   State: {first_session.get('mountState', 'Unknown')}")
+        # Look up iSCSI details for every mounted session in one pipelined batch
+        iscsi_infos = veeam_api.get_iscsi_mount_info_batch([session['id'] for session in mounted_sessions])
+        
+        for session in mounted_sessions:
+            session_id = session['id']
+            # Collect each session's report and write it in one call rather than per line
+            out = [
+                f"\n🔍 Testing session: {session_id}",
+                f"   Backup: {session.get('backupName', 'Unknown')}",
+                f"   State: {session.get('mountState', 'Unknown')}"
+            ]
+            
+            iscsi_info = iscsi_infos.get(session_id)
+            if iscsi_info is None:
+                out.append("❌ Failed to get iSCSI info")
+                sys.stdout.write('\n'.join(out) + '\n')
+                continue
+            
+            out += [
+                "\n📋 iSCSI Mount Information:",
+                f"   Session ID: {iscsi_info['session_id']}",
+                f"   Mount State: {iscsi_info['mount_state']}",
+                f"   Backup Name: {iscsi_info['backup_name']}",
+                f"   Restore Point: {iscsi_info['restore_point_name']}",
+                "\n🎯 iSCSI Targets:"
+            ]
+            for i, target in enumerate(iscsi_info['iscsi_targets']):
+                out += [
+                    f"   Target {i+1}:",
+                    f"     IQN: {target['iqn']}",
+                    f"     Server IP: {target['server_ips'][0] if target['server_ips'] else 'N/A'}",
+                    f"     Port: {target['server_port']}"
+                ]
+            
+            out.append("\n🛠️  Access Methods:")
+            for i, method in enumerate(iscsi_info['access_methods']):
+                out.append(f"   Method {i+1}: {method['method']}")
+                out.append(f"     Description: {method['description']}")
+                if 'command' in method:
+                    out.append(f"     Command: {method['command']}")
+                if 'unc_path' in method:
+                    out.append(f"     UNC Path: {method['unc_path']}")
+                if 'server_path' in method:
+                    out.append(f"     Server Path: {method['server_path']}")
+                out.append("")
             
-            # Get detailed iSCSI information
-            try:
-                iscsi_info = veeam_api.get_iscsi_mount_info(session_id)
-                print(f"\n📋 iSCSI Mount Information:")
-                print(f"   Session ID: {iscsi_info['session_id']}")
-                print(f"   Mount State: {iscsi_info['mount_state']}")
-                print(f"   Backup Name: {iscsi_info['backup_name']}")
-                print(f"   Restore Point: {iscsi_info['restore_point_name']}")
-                
-                print(f"\n🎯 iSCSI Targets:")
-                for i, target in enumerate(iscsi_info['iscsi_targets']):
-                    print(f"   Target {i+1}:")
-                    print(f"     IQN: {target['iqn']}")
-                    print(f"     Server IP: {target['server_ips'][0] if target['server_ips'] else 'N/A'}")
-                    print(f"     Port: {target['server_port']}")
-                
-                print(f"\n🛠️  Access Methods:")
-                for i, method in enumerate(iscsi_info['access_methods']):
-                    print(f"   Method {i+1}: {method['method']}")
-                    print(f"     Description: {method['description']}")
-                    if 'command' in method:
-                        print(f"     Command: {method['command']}")
-                    if 'unc_path' in method:
-                        print(f"     UNC Path: {method['unc_path']}")
-                    if 'server_path' in method:
-                        print(f"     Server Path: {method['server_path']}")
-                    print()
-                
-            except VeeamAPIError as e:
-                print(f"❌ Failed to get iSCSI info: {str(e)}")
+            sys.stdout.write('\n'.join(out) + '\n')
         
     except VeeamAPIError as e:
         print(f"❌ Error: {str(e)}")
@@ -83,17 +111,10 @@ def test_flr_session_creation():
     """Test creating FLR sessions."""
     print("\n=== Testing FLR Session Creation ===")
     
-    # Initialize API
-    veeam_api = VeeamDataIntegrationAPI(
-        base_url="https://172.21.234.6:9419",
-        username="administrator",
-        password="Veeam123",
-        verify_ssl=False
-    )
-    
     try:
-        # Authenticate
-        if not veeam_api.authenticate():
+        # Authenticate (reuses the token from an earlier test while it is valid)
+        veeam_api = _get_api("https://172.21.234.6:9419", "administrator", "Veeam123")
+        if veeam_api is None:
             print("❌ Authentication failed")
             return
         
@@ -116,9 +137,7 @@ def test_flr_session_creation():
             if session_id:
                 try:
                     mount_points = veeam_api.get_flr_mount_points(session_id)
-                    print(f"📁 FLR Mount Points:")
-                    for point in mount_points:
-                        print(f"   {point}")
+                    sys.stdout.write('\n'.join(["📁 FLR Mount Points:"] + [f"   {point}" for point in mount_points]) + '\n')
                 except VeeamAPIError as e:
                     print(f"⚠️  Could not get mount points: {str(e)}")
             
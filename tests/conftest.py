@@ -2,76 +2,159 @@
 Pytest configuration and fixtures for the Veeam ML Integration tests.
 """
 import os
+import sqlite3
 import sys
-import tempfile
 import pytest
-from flask import Flask
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+# The engine is bound when src.main is imported, so point it at an in-memory
+# database first; Flask-SQLAlchemy shares one connection (StaticPool) for it,
+# and each xdist worker process gets its own private copy
+_DATABASE_URI = os.environ.setdefault('SQLALCHEMY_DATABASE_URI', 'sqlite://')
+_FILE_BACKED_SQLITE = _DATABASE_URI.startswith('sqlite:///') and ':memory:' not in _DATABASE_URI
+
 from src.main import app as flask_app
-from src.models.user import db
+from src.models.veeam_backup import db
 
+# Durability is worthless for a throwaway test database; EXCLUSIVE locking is
+# left out because db_session and the app session use separate connections
+_TEST_SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=MEMORY',
+    'PRAGMA synchronous=OFF',
+    'PRAGMA temp_store=MEMORY',
+)
 
-@pytest.fixture
-def app():
-    """Create and configure a test Flask application."""
-    # Create a temporary database file
-    db_fd, db_path = tempfile.mkstemp()
+
+def _configure_sqlite(dbapi_connection, connection_record):
+    """Prepare each SQLite connection opened by the test engine.
+    
+    pysqlite defers BEGIN until the first DML statement, which lets a
+    RELEASE SAVEPOINT commit for real; switching it to autocommit and emitting
+    BEGIN from _emit_begin lets db_session's outer transaction roll
+    everything back. A file-backed database (set through
+    SQLALCHEMY_DATABASE_URI) also skips journaling and fsyncs.
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
     
-    # Configure test app
+    dbapi_connection.isolation_level = None
+    if _FILE_BACKED_SQLITE:
+        cursor = dbapi_connection.cursor()
+        for pragma in _TEST_SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def _emit_begin(conn):
+    """Open SQLite transactions explicitly so SAVEPOINTs nest inside them."""
+    conn.exec_driver_sql('BEGIN')
+
+
+@pytest.fixture(scope='session')
+def app():
+    """Configure the Flask application and create the schema once per test run."""
     flask_app.config.update({
         'TESTING': True,
-        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}',
-        'SQLALCHEMY_TRACK_MODIFICATIONS': False,
         'SECRET_KEY': 'test-secret-key'
     })
     
     with flask_app.app_context():
+        engine = db.engine
+        if engine.dialect.name == 'sqlite':
+            event.listen(engine, 'connect', _configure_sqlite)
+            event.listen(engine, 'begin', _emit_begin)
+            if isinstance(engine.pool, StaticPool):
+                # src.main already opened the single shared in-memory
+                # connection, so the connect hook has to be applied by hand
+                raw = engine.raw_connection()
+                _configure_sqlite(raw.driver_connection, None)
+                raw.close()
+            else:
+                # Reopen pooled file connections so they go through the hook
+                engine.dispose()
+        
         db.create_all()
         yield flask_app
         db.drop_all()
+
+
+@pytest.fixture
+def db_session(app):
+    """Database session whose writes are rolled back after each test.
     
-    os.close(db_fd)
-    os.unlink(db_path)
+    Each test runs in an outer transaction on one connection and the session
+    turns its commits into SAVEPOINT releases, so rolling back the outer
+    transaction undoes everything the test wrote without touching the schema.
+    """
+    with app.app_context():
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        app_session = db.session
+        db.session = scoped_session(sessionmaker(
+            bind=connection,
+            join_transaction_mode='create_savepoint'
+        ))
+        
+        yield db.session
+        
+        db.session.remove()
+        db.session = app_session
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture
-def client(app):
-    """Create a test client for the Flask application."""
+def client(app, db_session):
+    """Create a test client whose requests run inside the test transaction."""
     return app.test_client()
 
 
 @pytest.fixture
-def runner(app):
-    """Create a test CLI runner for the Flask application."""
+def runner(app, db_session):
+    """Create a test CLI runner whose commands write inside the test transaction."""
     return app.test_cli_runner()
 
 
 @pytest.fixture
-def mock_veeam_api():
+def mock_veeam_api(monkeypatch):
     """Mock Veeam API responses for testing."""
-    with patch('src.services.veeam_api.VeeamAPI') as mock_api:
-        mock_instance = Mock()
-        mock_api.return_value = mock_instance
-        
-        # Mock successful API responses
-        mock_instance.test_connection.return_value = True
-        mock_instance.list_backups.return_value = [
-            {
-                'id': 'backup-1',
-                'name': 'Test Backup',
-                'size': 1024000,
-                'created': '2024-01-01T00:00:00Z',
-                'status': 'Success'
-            }
-        ]
-        mock_instance.mount_backup.return_value = {'mount_path': '/tmp/mount-123'}
-        mock_instance.unmount_backup.return_value = True
-        
-        yield mock_instance
+    mock_instance = Mock()
+    
+    # Mock successful API responses
+    mock_instance.authenticate.return_value = True
+    mock_instance.test_connection.return_value = True
+    mock_instance.list_backups.return_value = [
+        {
+            'id': 'backup-1',
+            'name': 'Test Backup',
+            'size': 1024000,
+            'created': '2024-01-01T00:00:00Z',
+            'status': 'Success'
+        }
+    ]
+    mock_instance.mount_backup.return_value = {'mount_path': '/tmp/mount-123'}
+    mock_instance.unmount_backup.return_value = True
+    
+    # monkeypatch restores both the class and the routes' module-level client
+    # after each test, so no state leaks between tests or xdist workers
+    monkeypatch.setattr('src.routes.veeam_routes.VeeamDataIntegrationAPI', lambda *args, **kwargs: mock_instance)
+    monkeypatch.setattr('src.routes.veeam_routes.veeam_api', mock_instance)
+    
+    yield mock_instance
+
+
+@pytest.fixture(scope='session')
+def veeam_api():
+    """Shared unauthenticated VeeamDataIntegrationAPI client."""
+    from src.services.veeam_api import VeeamDataIntegrationAPI
+    return VeeamDataIntegrationAPI('https://test-server:9419', 'user', 'pass')
+
 
 
 @pytest.fixture
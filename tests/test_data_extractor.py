@@ -1,8 +1,11 @@
 """
 Tests for data extraction services.
 """
+import os
+import sqlite3
 import pytest
 import pandas as pd
+from functools import lru_cache
 from unittest.mock import Mock, patch, mock_open
 from src.services.data_extractor import (
     BaseDataExtractor, 
@@ -15,6 +18,47 @@ from src.services.data_extractor import (
 )
 
 
+
+@lru_cache(maxsize=None)
+def _mopen(data: str):
+    """Build one mock_open() per distinct file content and reuse it.
+    
+    mock_open rewinds its read_data on every open() call, so a cached mock
+    serves the full content to each test that shares it.
+    """
+    return mock_open(read_data=data)
+
+
+@pytest.fixture
+def fake_file(monkeypatch):
+    """Serve the given text from open() and report every path as existing."""
+    def install(content):
+        monkeypatch.setattr('builtins.open', _mopen(content))
+        monkeypatch.setattr('os.path.exists', lambda path: True)
+    return install
+
+
+@pytest.fixture(scope="module")
+def real_sqlite(tmp_path_factory):
+    """SQLite database file with a two-row users table, built once per module."""
+    path = tmp_path_factory.mktemp("db") / "test.db"
+    conn = sqlite3.connect(str(path))
+    conn.executescript(
+        "CREATE TABLE users(id INT, first_name TEXT, last_name TEXT, email TEXT);"
+        "INSERT INTO users VALUES (1, 'John', 'Doe', 'john@example.com'),"
+        " (2, 'Jane', 'Smith', 'jane@example.com');"
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture(scope="module")
+def extraction_service():
+    """DataExtractionService shared by the tests that do not modify it."""
+    return DataExtractionService('/tmp/mount')
+
+
 class TestBaseDataExtractor:
     """Test cases for BaseDataExtractor class."""
     
@@ -66,23 +110,21 @@ class TestLogFileExtractor:
         for pattern in expected_patterns:
             assert pattern in extractor.log_patterns
     
-    def test_extract_with_mock_file(self):
+    def test_extract_with_mock_file(self, fake_file):
         """Test log extraction with mocked file."""
         extractor = LogFileExtractor('/tmp/mount')
         
         # Mock log content
-        log_content = """192.168.1.1 - - [25/Dec/2023:10:00:00 +0000] "GET /index.html HTTP/1.1" 200 1234
-192.168.1.2 - - [25/Dec/2023:10:01:00 +0000] "POST /api/data HTTP/1.1" 201 5678"""
+        fake_file("""192.168.1.1 - - [25/Dec/2023:10:00:00 +0000] "GET /index.html HTTP/1.1" 200 1234
+192.168.1.2 - - [25/Dec/2023:10:01:00 +0000] "POST /api/data HTTP/1.1" 201 5678""")
+        
+        result = extractor.extract('access.log', log_format='apache_access')
         
-        with patch("builtins.open", mock_open(read_data=log_content)):
-            with patch('os.path.exists', return_value=True):
-                result = extractor.extract('access.log', log_format='apache_access')
-                
-                assert isinstance(result, pd.DataFrame)
-                assert len(result) == 2
-                assert 'ip' in result.columns
-                assert 'timestamp' in result.columns
-                assert 'method' in result.columns
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == 2
+        assert 'ip' in result.columns
+        assert 'timestamp' in result.columns
+        assert 'method' in result.columns
 
 
 class TestDatabaseExtractor:
@@ -94,32 +136,18 @@ class TestDatabaseExtractor:
         assert extractor is not None
         assert extractor.mount_point == '/tmp/mount'
     
-    def test_extract_sqlite_with_mock(self):
-        """Test SQLite extraction with mocked database."""
-        extractor = DatabaseExtractor('/tmp/mount')
+    def test_extract_sqlite(self, real_sqlite):
+        """Test SQLite extraction from a real database file."""
+        extractor = DatabaseExtractor(str(real_sqlite.parent))
         
-        # Mock SQLite connection and cursor
-        mock_cursor = Mock()
-        mock_cursor.fetchall.return_value = [
-            (1, 'John', 'Doe', 'john@example.com'),
-            (2, 'Jane', 'Smith', 'jane@example.com')
-        ]
-        mock_cursor.description = [
-            ('id',), ('first_name',), ('last_name',), ('email',)
-        ]
+        result = extractor.extract(real_sqlite.name, table_name='users')
         
-        mock_conn = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        
-        with patch('sqlite3.connect', return_value=mock_conn):
-            result = extractor.extract('test.db', table_name='users')
-            
-            assert isinstance(result, pd.DataFrame)
-            assert len(result) == 2
-            assert 'id' in result.columns
-            assert 'first_name' in result.columns
-            assert 'last_name' in result.columns
-            assert 'email' in result.columns
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == 2
+        assert 'id' in result.columns
+        assert 'first_name' in result.columns
+        assert 'last_name' in result.columns
+        assert 'email' in result.columns
 
 
 class TestConfigFileExtractor:
@@ -131,20 +159,18 @@ class TestConfigFileExtractor:
         assert extractor is not None
         assert extractor.mount_point == '/tmp/mount'
     
-    def test_extract_json_config(self):
+    def test_extract_json_config(self, fake_file):
         """Test JSON config file extraction."""
         extractor = ConfigFileExtractor('/tmp/mount')
         
-        json_content = '{"database": {"host": "localhost", "port": 5432}, "api": {"key": "secret"}}'
+        fake_file('{"database": {"host": "localhost", "port": 5432}, "api": {"key": "secret"}}')
+        
+        result = extractor.extract('config.json')
         
-        with patch("builtins.open", mock_open(read_data=json_content)):
-            with patch('os.path.exists', return_value=True):
-                result = extractor.extract('config.json')
-                
-                assert isinstance(result, pd.DataFrame)
-                assert len(result) > 0
-                assert 'key' in result.columns
-                assert 'value' in result.columns
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) > 0
+        assert 'key' in result.columns
+        assert 'value' in result.columns
 
 
 class TestStructuredDataExtractor:
@@ -156,43 +182,31 @@ class TestStructuredDataExtractor:
         assert extractor is not None
         assert extractor.mount_point == '/tmp/mount'
     
-    def test_extract_csv_file(self):
+    def test_extract_csv_file(self, tmp_path):
         """Test CSV file extraction."""
-        extractor = StructuredDataExtractor('/tmp/mount')
+        (tmp_path / 'data.csv').write_text("name,age,city\nJohn,25,New York\nJane,30,London")
+        extractor = StructuredDataExtractor(str(tmp_path))
         
-        csv_content = "name,age,city\nJohn,25,New York\nJane,30,London"
+        result = extractor.extract('data.csv')
         
-        with patch("builtins.open", mock_open(read_data=csv_content)):
-            with patch('os.path.exists', return_value=True):
-                with patch('pandas.read_csv') as mock_read_csv:
-                    mock_df = pd.DataFrame({
-                        'name': ['John', 'Jane'],
-                        'age': [25, 30],
-                        'city': ['New York', 'London']
-                    })
-                    mock_read_csv.return_value = mock_df
-                    
-                    result = extractor.extract('data.csv')
-                    
-                    assert isinstance(result, pd.DataFrame)
-                    assert len(result) == 2
-                    assert 'name' in result.columns
-                    assert 'age' in result.columns
-                    assert 'city' in result.columns
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == 2
+        assert 'name' in result.columns
+        assert 'age' in result.columns
+        assert 'city' in result.columns
 
 
 class TestDataExtractionService:
     """Test cases for DataExtractionService class."""
     
-    def test_init(self):
+    def test_init(self, extraction_service):
         """Test DataExtractionService initialization."""
-        service = DataExtractionService()
-        assert service is not None
-        assert hasattr(service, 'extractors')
+        assert extraction_service is not None
+        assert hasattr(extraction_service, 'extractors')
     
-    def test_get_extractor_for_file_type(self):
+    def test_get_extractor_for_file_type(self, extraction_service):
         """Test getting appropriate extractor for file type."""
-        service = DataExtractionService()
+        service = extraction_service
         
         # Test log file
         extractor = service.get_extractor_for_file_type('access.log')
@@ -225,32 +239,29 @@ class TestDataExtractionService:
             assert len(result) == 3
             assert 'test' in result.columns
     
-    def test_extract_from_directory(self):
-        """Test extracting data from a directory."""
-        service = DataExtractionService()
+    def test_scan_directory(self, tmp_path):
+        """Test scanning a directory for extractable files."""
+        (tmp_path / 'logs').mkdir()
+        (tmp_path / 'logs' / 'app.log').write_text("2024-01-01 INFO started\n")
+        (tmp_path / 'data.csv').write_text("a,b\n1,2\n")
+        (tmp_path / 'settings.json').write_text('{"debug": true}')
+        service = DataExtractionService(str(tmp_path))
         
-        # Mock directory structure
-        mock_files = [
-            '/tmp/mount/file1.log',
-            '/tmp/mount/file2.csv',
-            '/tmp/mount/file3.json'
-        ]
+        results = service.scan_directory('/')
         
-        with patch('os.walk') as mock_walk:
-            mock_walk.return_value = [('/tmp/mount', [], ['file1.log', 'file2.csv', 'file3.json'])]
-            
-            with patch.object(service, 'extract_from_file') as mock_extract:
-                mock_extract.side_effect = [
-                    pd.DataFrame({'log_data': [1, 2]}),
-                    pd.DataFrame({'csv_data': [3, 4]}),
-                    pd.DataFrame({'json_data': [5, 6]})
-                ]
-                
-                results = service.extract_from_directory('/tmp/mount')
-                
-                assert len(results) == 3
-                assert all(isinstance(result, pd.DataFrame) for result in results)
-                assert mock_extract.call_count == 3
+        by_path = {result['path']: result for result in results}
+        assert set(by_path) == {os.path.join('logs', 'app.log'), 'data.csv', 'settings.json'}
+        assert by_path[os.path.join('logs', 'app.log')]['suggested_extractor'] == 'log'
+        assert by_path['data.csv']['suggested_extractor'] == 'structured'
+        assert by_path['settings.json']['suggested_extractor'] == 'config'
+        assert all(result['extractable'] for result in results)
+    
+    def test_scan_directory_missing(self, tmp_path):
+        """Test scanning a directory that does not exist."""
+        service = DataExtractionService(str(tmp_path))
+        
+        with pytest.raises(DataExtractionError):
+            service.scan_directory('/missing')
 
 
 class TestDataExtractionError:
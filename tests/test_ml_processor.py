@@ -14,6 +14,49 @@ from src.services.ml_processor import (
 )
 
 
+# The functional tests only check that models fit and report their metrics, so
+# two shallow trees are enough; the full-size forest is exercised by the slow accuracy test
+FAST_RF_PARAMS = {'n_estimators': 2, 'max_depth': 2, 'random_state': 42}
+
+
+@pytest.fixture(scope="module")
+def trained_classifier():
+    """Train a classifier once and share it across the classification tests."""
+    processor = ClassificationProcessor()
+    X = pd.DataFrame({
+        'feature1': range(1, 11),
+        'feature2': range(2, 22, 2)
+    })
+    y = pd.Series([0, 0, 1, 1, 1, 0, 1, 0, 1, 0])
+    results = processor.train_and_predict(X, y, model_params=FAST_RF_PARAMS)
+    return processor, results
+
+
+@pytest.fixture(scope="module")
+def trained_regressor():
+    """Train a regressor once and share it across the regression tests."""
+    processor = RegressionProcessor()
+    X = pd.DataFrame({
+        'feature1': range(1, 11),
+        'feature2': range(2, 22, 2)
+    })
+    y = pd.Series([1.5 * value for value in range(1, 11)])
+    results = processor.train_and_predict(X, y, model_params=FAST_RF_PARAMS)
+    return processor, results
+
+
+@pytest.fixture(scope="module")
+def trained_clusterer():
+    """Fit a two-cluster model once and share it across the clustering tests."""
+    processor = ClusteringProcessor()
+    X = pd.DataFrame({
+        'feature1': [1, 2, 3, 4, 5],
+        'feature2': [2, 4, 6, 8, 10]
+    })
+    results = processor.perform_clustering(X, n_clusters=2)
+    return processor, results
+
+
 class TestDataPreprocessor:
     """Test cases for DataPreprocessor class."""
     
@@ -76,21 +119,13 @@ class TestClassificationProcessor:
         processor = ClassificationProcessor()
         assert processor is not None
     
-    def test_train_model(self):
+    def test_train_model(self, trained_classifier):
         """Test model training."""
-        processor = ClassificationProcessor()
-        
-        # Create sample training data
-        X = pd.DataFrame({
-            'feature1': [1, 2, 3, 4, 5],
-            'feature2': [2, 4, 6, 8, 10]
-        })
-        y = pd.Series([0, 0, 1, 1, 1])
+        processor, results = trained_classifier
         
-        model = processor.train_model(X, y, {'n_estimators': 10, 'random_state': 42})
-        
-        assert model is not None
-        assert hasattr(model, 'predict')
+        assert results['model_type'] == 'classification'
+        assert hasattr(processor.model, 'predict')
+        assert results['model_params']['n_estimators'] == FAST_RF_PARAMS['n_estimators']
     
     def test_train_model_insufficient_data(self):
         """Test model training with insufficient data."""
@@ -103,18 +138,9 @@ class TestClassificationProcessor:
         with pytest.raises(MLProcessingError):
             processor.train_model(X, y, {})
     
-    def test_predict(self):
+    def test_predict(self, trained_classifier):
         """Test model prediction."""
-        processor = ClassificationProcessor()
-        
-        # Train a model first
-        X_train = pd.DataFrame({
-            'feature1': [1, 2, 3, 4, 5],
-            'feature2': [2, 4, 6, 8, 10]
-        })
-        y_train = pd.Series([0, 0, 1, 1, 1])
-        
-        model = processor.train_model(X_train, y_train, {'n_estimators': 10, 'random_state': 42})
+        processor, _ = trained_classifier
         
         # Test prediction
         X_test = pd.DataFrame({
@@ -122,30 +148,38 @@ class TestClassificationProcessor:
             'feature2': [12, 14]
         })
         
-        predictions = processor.predict(model, X_test)
+        predictions = np.asarray(processor.model.predict(X_test))
         
-        assert len(predictions) == 2
-        assert all(isinstance(pred, (int, np.integer)) for pred in predictions)
+        assert predictions.shape == (2,)
+        assert predictions.dtype.kind in 'iu'
     
-    def test_evaluate_model(self):
+    def test_evaluate_model(self, trained_classifier):
         """Test model evaluation."""
+        _, results = trained_classifier
+        
+        metrics = results['classification_report']['weighted avg']
+        
+        assert isinstance(results['accuracy'], (int, float))
+        assert 'precision' in metrics
+        assert 'recall' in metrics
+        assert 'f1-score' in metrics
+        assert all(isinstance(metric, (int, float)) for metric in metrics.values())
+    
+    @pytest.mark.slow
+    def test_train_and_predict_accuracy(self):
+        """Test the full-size forest separates a cleanly split dataset."""
         processor = ClassificationProcessor()
         
-        # Create sample data
         X = pd.DataFrame({
-            'feature1': [1, 2, 3, 4, 5, 6],
-            'feature2': [2, 4, 6, 8, 10, 12]
+            'feature1': range(40),
+            'feature2': [value * 2 for value in range(40)]
         })
-        y = pd.Series([0, 0, 1, 1, 1, 0])
+        y = pd.Series([int(value >= 20) for value in range(40)])
         
-        model = processor.train_model(X, y, {'n_estimators': 10, 'random_state': 42})
-        metrics = processor.evaluate_model(model, X, y)
+        results = processor.train_and_predict(X, y)
         
-        assert 'accuracy' in metrics
-        assert 'precision' in metrics
-        assert 'recall' in metrics
-        assert 'f1_score' in metrics
-        assert all(isinstance(metric, (int, float)) for metric in metrics.values())
+        assert results['model_params']['n_estimators'] == 100
+        assert results['accuracy'] >= 0.75
 
 
 class TestRegressionProcessor:
@@ -156,39 +190,19 @@ class TestRegressionProcessor:
         processor = RegressionProcessor()
         assert processor is not None
     
-    def test_train_model(self):
+    def test_train_model(self, trained_regressor):
         """Test regression model training."""
-        processor = RegressionProcessor()
-        
-        # Create sample training data
-        X = pd.DataFrame({
-            'feature1': [1, 2, 3, 4, 5],
-            'feature2': [2, 4, 6, 8, 10]
-        })
-        y = pd.Series([1.5, 3.0, 4.5, 6.0, 7.5])
-        
-        model = processor.train_model(X, y, {'n_estimators': 10, 'random_state': 42})
+        processor, results = trained_regressor
         
-        assert model is not None
-        assert hasattr(model, 'predict')
+        assert results['model_type'] == 'regression'
+        assert hasattr(processor.model, 'predict')
     
-    def test_evaluate_model(self):
+    def test_evaluate_model(self, trained_regressor):
         """Test regression model evaluation."""
-        processor = RegressionProcessor()
+        _, results = trained_regressor
         
-        # Create sample data
-        X = pd.DataFrame({
-            'feature1': [1, 2, 3, 4, 5],
-            'feature2': [2, 4, 6, 8, 10]
-        })
-        y = pd.Series([1.5, 3.0, 4.5, 6.0, 7.5])
-        
-        model = processor.train_model(X, y, {'n_estimators': 10, 'random_state': 42})
-        metrics = processor.evaluate_model(model, X, y)
+        metrics = {name: results[name] for name in ('mse', 'rmse', 'r2_score')}
         
-        assert 'mse' in metrics
-        assert 'rmse' in metrics
-        assert 'r2_score' in metrics
         assert all(isinstance(metric, (int, float)) for metric in metrics.values())
 
 
@@ -200,32 +214,16 @@ class TestClusteringProcessor:
         processor = ClusteringProcessor()
         assert processor is not None
     
-    def test_train_model(self):
+    def test_train_model(self, trained_clusterer):
         """Test clustering model training."""
-        processor = ClusteringProcessor()
-        
-        # Create sample training data
-        X = pd.DataFrame({
-            'feature1': [1, 2, 3, 4, 5],
-            'feature2': [2, 4, 6, 8, 10]
-        })
+        processor, results = trained_clusterer
         
-        model = processor.train_model(X, None, {'n_clusters': 2, 'random_state': 42})
-        
-        assert model is not None
-        assert hasattr(model, 'predict')
+        assert results['n_clusters'] == 2
+        assert hasattr(processor.model, 'predict')
     
-    def test_predict(self):
+    def test_predict(self, trained_clusterer):
         """Test clustering prediction."""
-        processor = ClusteringProcessor()
-        
-        # Train a model first
-        X_train = pd.DataFrame({
-            'feature1': [1, 2, 3, 4, 5],
-            'feature2': [2, 4, 6, 8, 10]
-        })
-        
-        model = processor.train_model(X_train, None, {'n_clusters': 2, 'random_state': 42})
+        processor, _ = trained_clusterer
         
         # Test prediction
         X_test = pd.DataFrame({
@@ -233,8 +231,8 @@ class TestClusteringProcessor:
             'feature2': [12, 14]
         })
         
-        predictions = processor.predict(model, X_test)
+        predictions = np.asarray(processor.model.predict(X_test))
         
-        assert len(predictions) == 2
-        assert all(isinstance(pred, (int, np.integer)) for pred in predictions)
-        assert all(0 <= pred < 2 for pred in predictions)  # Should be cluster labels 0 or 1
+        assert predictions.shape == (2,)
+        assert predictions.dtype.kind in 'iu'
+        assert ((predictions >= 0) & (predictions < 2)).all()  # Should be cluster labels 0 or 1
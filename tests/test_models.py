@@ -6,142 +6,113 @@ from datetime import datetime
 from src.models.veeam_backup import VeeamBackup, MLJob, DataExtraction
 
 
+# Fixed so the samples, and anything serialized from them, are deterministic
+_FIXED_TS = datetime(2024, 1, 1, 12, 0, 0)
+
+ML_JOB_FIELDS = {
+    'job_name': 'Test ML Job',
+    'ml_algorithm': 'classification',
+    'parameters': '{"n_estimators": 100, "max_depth": 10}',
+    'backup_id': 1,
+    'status': 'pending'
+}
+
+
+# The samples are built once per module and only read by the tests below;
+# a test that changes a model must build its own instance
+@pytest.fixture(scope="module")
+def _sample_backup(app):
+    """VeeamBackup shared by the read-only backup tests."""
+    return VeeamBackup(
+        backup_id='test-backup-1',
+        backup_name='Test Backup',
+        backup_path='/path/to/backup',
+        backup_date=_FIXED_TS,
+        backup_size=1024000,
+        status='available'
+    )
+
+
+@pytest.fixture(scope="module")
+def _sample_ml_job(app):
+    """MLJob shared by the read-only ML job tests."""
+    return MLJob(**ML_JOB_FIELDS)
+
+
+@pytest.fixture(scope="module")
+def _sample_extraction(app):
+    """DataExtraction shared by the read-only extraction tests."""
+    return DataExtraction(
+        ml_job_id=1,
+        file_path='/path/to/file.txt',
+        file_type='text',
+        extraction_method='direct_read',
+        extracted_records=100,
+        extraction_status='completed'
+    )
+
+
+def _fields(model, serialize):
+    """Return the model's attributes, or its to_dict() output when serializing."""
+    if serialize:
+        serialized = model.to_dict()
+        assert isinstance(serialized, dict)
+        return serialized
+    return vars(model)
+
+
+@pytest.mark.fast
 class TestVeeamBackupModel:
     """Test cases for VeeamBackup model."""
     
-    def test_create_backup(self, app):
-        """Test creating a VeeamBackup record."""
-        with app.app_context():
-            backup = VeeamBackup(
-                backup_id='test-backup-1',
-                name='Test Backup',
-                size=1024000,
-                created_date=datetime.now(),
-                status='Success',
-                repository='Test Repository'
-            )
-            
-            assert backup.backup_id == 'test-backup-1'
-            assert backup.name == 'Test Backup'
-            assert backup.size == 1024000
-            assert backup.status == 'Success'
-    
-    def test_backup_serialization(self, app):
-        """Test backup model serialization."""
-        with app.app_context():
-            backup = VeeamBackup(
-                backup_id='test-backup-1',
-                name='Test Backup',
-                size=1024000,
-                created_date=datetime.now(),
-                status='Success',
-                repository='Test Repository'
-            )
-            
-            serialized = backup.to_dict()
-            
-            assert isinstance(serialized, dict)
-            assert serialized['backup_id'] == 'test-backup-1'
-            assert serialized['name'] == 'Test Backup'
-            assert serialized['size'] == 1024000
+    @pytest.mark.parametrize("serialize", [False, True], ids=['attrs', 'serialization'])
+    def test_backup_fields(self, _sample_backup, serialize):
+        """Test VeeamBackup attributes and serialization."""
+        fields = _fields(_sample_backup, serialize)
+        
+        assert fields['backup_id'] == 'test-backup-1'
+        assert fields['backup_name'] == 'Test Backup'
+        assert fields['backup_path'] == '/path/to/backup'
+        assert fields['backup_size'] == 1024000
+        assert fields['status'] == 'available'
 
 
+@pytest.mark.fast
 class TestMLJobModel:
     """Test cases for MLJob model."""
     
-    def test_create_ml_job(self, app):
-        """Test creating an MLJob record."""
-        with app.app_context():
-            job = MLJob(
-                name='Test ML Job',
-                algorithm='classification',
-                parameters={'n_estimators': 100, 'max_depth': 10},
-                backup_id='test-backup-1',
-                status='pending'
-            )
-            
-            assert job.name == 'Test ML Job'
-            assert job.algorithm == 'classification'
-            assert job.parameters['n_estimators'] == 100
-            assert job.status == 'pending'
-    
-    def test_ml_job_serialization(self, app):
-        """Test ML job model serialization."""
-        with app.app_context():
-            job = MLJob(
-                name='Test ML Job',
-                algorithm='classification',
-                parameters={'n_estimators': 100},
-                backup_id='test-backup-1',
-                status='pending'
-            )
-            
-            serialized = job.to_dict()
-            
-            assert isinstance(serialized, dict)
-            assert serialized['name'] == 'Test ML Job'
-            assert serialized['algorithm'] == 'classification'
-            assert serialized['parameters']['n_estimators'] == 100
+    @pytest.mark.parametrize("serialize", [False, True], ids=['attrs', 'serialization'])
+    def test_ml_job_fields(self, _sample_ml_job, serialize):
+        """Test MLJob attributes and serialization."""
+        fields = _fields(_sample_ml_job, serialize)
+        
+        assert fields['job_name'] == 'Test ML Job'
+        assert fields['ml_algorithm'] == 'classification'
+        assert fields['parameters'] == '{"n_estimators": 100, "max_depth": 10}'
+        assert fields['backup_id'] == 1
+        assert fields['status'] == 'pending'
     
-    def test_ml_job_status_updates(self, app):
+    @pytest.mark.parametrize("new_status", ['running', 'completed', 'failed'])
+    def test_ml_job_status_updates(self, app, new_status):
         """Test ML job status updates."""
-        with app.app_context():
-            job = MLJob(
-                name='Test ML Job',
-                algorithm='classification',
-                parameters={},
-                backup_id='test-backup-1',
-                status='pending'
-            )
-            
-            # Test status transitions
-            job.status = 'running'
-            assert job.status == 'running'
-            
-            job.status = 'completed'
-            assert job.status == 'completed'
-            
-            job.status = 'failed'
-            assert job.status == 'failed'
+        job = MLJob(**ML_JOB_FIELDS)
+        
+        job.status = new_status
+        assert job.status == new_status
 
 
+@pytest.mark.fast
 class TestDataExtractionModel:
     """Test cases for DataExtraction model."""
     
-    def test_create_data_extraction(self, app):
-        """Test creating a DataExtraction record."""
-        with app.app_context():
-            extraction = DataExtraction(
-                backup_id='test-backup-1',
-                file_path='/path/to/file.txt',
-                file_type='text',
-                file_size=1024,
-                extraction_status='completed',
-                extracted_data={'content': 'sample text'}
-            )
-            
-            assert extraction.backup_id == 'test-backup-1'
-            assert extraction.file_path == '/path/to/file.txt'
-            assert extraction.file_type == 'text'
-            assert extraction.file_size == 1024
-            assert extraction.extraction_status == 'completed'
-    
-    def test_data_extraction_serialization(self, app):
-        """Test data extraction model serialization."""
-        with app.app_context():
-            extraction = DataExtraction(
-                backup_id='test-backup-1',
-                file_path='/path/to/file.txt',
-                file_type='text',
-                file_size=1024,
-                extraction_status='completed',
-                extracted_data={'content': 'sample text'}
-            )
-            
-            serialized = extraction.to_dict()
-            
-            assert isinstance(serialized, dict)
-            assert serialized['backup_id'] == 'test-backup-1'
-            assert serialized['file_path'] == '/path/to/file.txt'
-            assert serialized['file_type'] == 'text'
-            assert serialized['extracted_data']['content'] == 'sample text'
+    @pytest.mark.parametrize("serialize", [False, True], ids=['attrs', 'serialization'])
+    def test_data_extraction_fields(self, _sample_extraction, serialize):
+        """Test DataExtraction attributes and serialization."""
+        fields = _fields(_sample_extraction, serialize)
+        
+        assert fields['ml_job_id'] == 1
+        assert fields['file_path'] == '/path/to/file.txt'
+        assert fields['file_type'] == 'text'
+        assert fields['extraction_method'] == 'direct_read'
+        assert fields['extracted_records'] == 100
+        assert fields['extraction_status'] == 'completed'
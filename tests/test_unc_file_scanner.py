@@ -0,0 +1,30 @@
+"""
+Tests for the UNC file scanner service.
+"""
+import socket
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from src.services.unc_file_scanner import UNCFileScanner
+
+
+def _entry(name, is_directory=False):
+    """Build a listPath() result entry."""
+    return SimpleNamespace(filename=name, file_size=0 if is_directory else 128,
+                           isDirectory=is_directory, create_time=0, last_write_time=0)
+
+
+class TestUNCFileScanner:
+    """Test cases for UNCFileScanner class."""
+    
+    def test_parallel_scan_skips_unreachable_directories(self):
+        """Test a worker connection failure skips its directory instead of the whole scan."""
+        scanner = UNCFileScanner('user', 'pass')
+        scanner.conn = Mock()
+        scanner.conn.listPath.return_value = [_entry('logs', True), _entry('app.log')]
+        
+        with patch('src.services.unc_file_scanner.SMBConnection') as mock_smb:
+            mock_smb.return_value.connect.side_effect = socket.timeout('timed out')
+            files = scanner.list_files(r'\\server\share\root', max_depth=2, max_workers=2)
+        
+        assert [f['name'] for f in files] == ['logs', 'app.log']
+        assert files[1]['extractable']
@@ -1,45 +1,110 @@
 """
 Tests for Veeam API routes and endpoints.
 """
-import json
 import pytest
-from unittest.mock import patch, Mock
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+from src.models.veeam_backup import VeeamBackup
 
+pytestmark = pytest.mark.integration
 
+# Constant request bodies shared by the tests below
+_VALID_CONFIG = {
+    'veeam_url': 'https://test-veeam-server:9419',
+    'username': 'testuser',
+    'password': 'testpass'
+}
+_INVALID_CONFIG = {
+    'veeam_url': '',  # Invalid empty URL
+    'username': 'testuser',
+    'password': 'testpass'
+}
+_ML_JOB = {
+    'job_name': 'Test Job',
+    'ml_algorithm': 'classification',
+    'parameters': {'n_estimators': 100}
+}
+_INVALID_ALGORITHM_JOB = {
+    'name': 'Test Job',
+    'algorithm': 'invalid_algorithm',
+    'parameters': {},
+    'backup_id': 'backup-1'
+}
+
+# The health check only asserts on key presence, which needs no JSON decoding
+_HEALTH_STATUS_KEY = b'"status":'
+_HEALTH_TIMESTAMP_KEY = b'"timestamp":'
+
+
+def _raise_api_error(*args, **kwargs):
+    raise Exception("API Error")
+
+
+class _StubRaisingAPI:
+    """Veeam client stand-in whose every backup request fails."""
+    
+    base_url = 'https://test-server:9419'
+    session = SimpleNamespace(get=_raise_api_error)
+    list_backups = staticmethod(_raise_api_error)
+
+
+@pytest.fixture
+def created_ml_job(client, db_session):
+    """Create an ML job on a mounted backup through the API and return its id.
+    
+    The backup and the job are removed when db_session rolls back the test's
+    transaction.
+    """
+    backup = VeeamBackup(
+        backup_id='backup-1',
+        backup_name='Test Backup',
+        backup_path='/path/to/backup',
+        backup_date=datetime(2024, 1, 1),
+        status='mounted'
+    )
+    db_session.add(backup)
+    db_session.flush()
+    
+    response = client.post('/api/veeam/ml-jobs', json={**_ML_JOB, 'backup_id': backup.id})
+    
+    assert response.status_code == 201, response.data
+    return response.get_json()['ml_job']['id']
+
+
+@pytest.mark.routes
 class TestVeeamRoutes:
     """Test cases for Veeam API routes."""
     
     def test_configure_veeam_connection_success(self, client, mock_veeam_api):
         """Test successful Veeam connection configuration."""
-        config_data = {
-            'veeam_url': 'https://test-veeam-server:9419',
-            'username': 'testuser',
-            'password': 'testpass'
-        }
-        
-        response = client.post('/api/veeam/configure', 
-                             data=json.dumps(config_data),
-                             content_type='application/json')
+        response = client.post('/api/veeam/configure', json=_VALID_CONFIG)
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert 'message' in data
     
-    def test_configure_veeam_connection_invalid_data(self, client):
-        """Test Veeam connection configuration with invalid data."""
-        config_data = {
-            'veeam_url': '',  # Invalid empty URL
+    def test_reconfigure_stops_previous_token_refresher(self, client, mock_veeam_api, monkeypatch):
+        """Test replacing the configured client stops the old client's refresher."""
+        previous = Mock()
+        monkeypatch.setattr('src.routes.veeam_routes.veeam_api', previous)
+        
+        response = client.post('/api/veeam/config', json={
+            'base_url': 'https://test-veeam-server:9419',
             'username': 'testuser',
             'password': 'testpass'
-        }
+        })
         
-        response = client.post('/api/veeam/configure',
-                             data=json.dumps(config_data),
-                             content_type='application/json')
+        assert response.status_code == 200
+        previous.stop_token_refresher.assert_called_once_with()
+    
+    def test_configure_veeam_connection_invalid_data(self, client):
+        """Test Veeam connection configuration with invalid data."""
+        response = client.post('/api/veeam/configure', json=_INVALID_CONFIG)
         
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
     
     def test_list_backups_success(self, client, mock_veeam_api):
@@ -47,30 +112,27 @@ class TestVeeamRoutes:
         response = client.get('/api/veeam/backups')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'backups' in data
         assert len(data['backups']) > 0
         assert data['backups'][0]['id'] == 'backup-1'
     
-    def test_list_backups_api_error(self, client):
+    def test_list_backups_api_error(self, client, monkeypatch):
         """Test backup listing when API fails."""
-        with patch('src.services.veeam_api.VeeamAPI') as mock_api:
-            mock_instance = Mock()
-            mock_api.return_value = mock_instance
-            mock_instance.list_backups.side_effect = Exception("API Error")
-            
-            response = client.get('/api/veeam/backups')
-            
-            assert response.status_code == 500
-            data = json.loads(response.data)
-            assert 'error' in data
+        monkeypatch.setattr('src.routes.veeam_routes.veeam_api', _StubRaisingAPI())
+        
+        response = client.get('/api/veeam/backups')
+        
+        assert response.status_code == 500
+        data = response.get_json()
+        assert 'error' in data
     
     def test_mount_backup_success(self, client, mock_veeam_api, sample_backup_data):
         """Test successful backup mounting."""
         response = client.post('/api/veeam/backups/backup-1/mount')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert 'mount_path' in data
     
@@ -79,35 +141,24 @@ class TestVeeamRoutes:
         response = client.post('/api/veeam/backups/backup-1/unmount')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
     
     def test_create_ml_job_success(self, client, sample_ml_job_data):
         """Test successful ML job creation."""
-        response = client.post('/api/veeam/ml-jobs',
-                             data=json.dumps(sample_ml_job_data),
-                             content_type='application/json')
+        response = client.post('/api/veeam/ml-jobs', json=sample_ml_job_data)
         
         assert response.status_code == 201
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] is True
         assert 'job_id' in data
     
     def test_create_ml_job_invalid_algorithm(self, client):
         """Test ML job creation with invalid algorithm."""
-        job_data = {
-            'name': 'Test Job',
-            'algorithm': 'invalid_algorithm',
-            'parameters': {},
-            'backup_id': 'backup-1'
-        }
-        
-        response = client.post('/api/veeam/ml-jobs',
-                             data=json.dumps(job_data),
-                             content_type='application/json')
+        response = client.post('/api/veeam/ml-jobs', json=_INVALID_ALGORITHM_JOB)
         
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
     
     def test_list_ml_jobs(self, client):
@@ -115,61 +166,30 @@ class TestVeeamRoutes:
         response = client.get('/api/veeam/ml-jobs')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'jobs' in data
         assert isinstance(data['jobs'], list)
     
-    def test_get_ml_job_status(self, client):
+    def test_get_ml_job_status(self, client, created_ml_job):
         """Test getting ML job status."""
-        # First create a job
-        job_data = {
-            'name': 'Test Job',
-            'algorithm': 'classification',
-            'parameters': {'n_estimators': 100},
-            'backup_id': 'backup-1'
-        }
-        
-        create_response = client.post('/api/veeam/ml-jobs',
-                                    data=json.dumps(job_data),
-                                    content_type='application/json')
+        response = client.get(f'/api/veeam/ml-jobs/{created_ml_job}')
         
-        if create_response.status_code == 201:
-            job_id = json.loads(create_response.data)['job_id']
-            
-            # Get job status
-            response = client.get(f'/api/veeam/ml-jobs/{job_id}/status')
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert 'status' in data
-    
-    def test_delete_ml_job(self, client):
+        assert response.status_code == 200
+        data = response.get_json()
+        assert 'status' in data
+    
+    def test_delete_ml_job(self, client, created_ml_job):
         """Test deleting ML job."""
-        # First create a job
-        job_data = {
-            'name': 'Test Job',
-            'algorithm': 'classification',
-            'parameters': {'n_estimators': 100},
-            'backup_id': 'backup-1'
-        }
+        response = client.delete(f'/api/veeam/ml-jobs/{created_ml_job}')
         
-        create_response = client.post('/api/veeam/ml-jobs',
-                                    data=json.dumps(job_data),
-                                    content_type='application/json')
-        
-        if create_response.status_code == 201:
-            job_id = json.loads(create_response.data)['job_id']
-            
-            # Delete job
-            response = client.delete(f'/api/veeam/ml-jobs/{job_id}')
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data['success'] is True
+        assert response.status_code == 200
+        data = response.get_json()
+        assert 'message' in data
     
     def test_health_check(self, client):
         """Test health check endpoint."""
         response = client.get('/api/veeam/health')
         
         assert response.status_code == 200
-        data = json.loads(response.data)
-        assert 'status' in data
-        assert 'timestamp' in data
+        assert _HEALTH_STATUS_KEY in response.data
+        assert _HEALTH_TIMESTAMP_KEY in response.data